@@ -1 +1,12 @@
 # This file makes the 'vflow' directory a Python package.
+
+__version__ = "0.1.5"
+
+
+def __getattr__(name: str):
+    # Load the actions façade on first use rather than with the package.
+    if name == "actions":
+        import importlib
+
+        return importlib.import_module(".actions", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,32 +7,42 @@ main.py and tests import ``actions.*``; the real implementations live in:
 - delivery_service – archive_file and copy_metadata_folder
 - backup_service   – consolidate_files, verify_backup, list_backups,
                      restore_folder, and list_duplicates
+
+Names resolve on first access, so a command only imports the service
+module it actually calls.
 """
 
-from .ingest_service import (  # noqa: F401
-    ingest_report,
-    ingest_shoot,
-    photo_ingest,
-    card_report,
-)
-
-from .delivery_service import (  # noqa: F401
-    archive_file,
-    copy_metadata_folder,
-)
-
-from .backup_service import (  # noqa: F401
-    consolidate_files,
-    verify_backup,
-    card_verify,
-    list_backups,
-    restore_folder,
-    list_duplicates,
-)
-
-# Re-export core helpers that tests import via actions.*
-from .core.patterns import (  # noqa: F401
-    _extract_number_from_filename,
-    _parse_range_pattern,
-    _matches_pattern,
-)
+import importlib
+
+_EXPORTS = {
+    "ingest_report": "ingest_service",
+    "ingest_shoot": "ingest_service",
+    "photo_ingest": "ingest_service",
+    "card_report": "ingest_service",
+    "archive_file": "delivery_service",
+    "copy_metadata_folder": "delivery_service",
+    "consolidate_files": "backup_service",
+    "verify_backup": "backup_service",
+    "card_verify": "backup_service",
+    "list_backups": "backup_service",
+    "restore_folder": "backup_service",
+    "list_duplicates": "backup_service",
+    # Core helpers that tests import via actions.*
+    "_extract_number_from_filename": "core.patterns",
+    "_parse_range_pattern": "core.patterns",
+    "_matches_pattern": "core.patterns",
+    "_filter_by_patterns": "core.patterns",
+}
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __package__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted({*globals(), *_EXPORTS})
@@ -1,14 +1,316 @@
 from __future__ import annotations
 
+import hashlib
+import os
+import sqlite3
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 import typer
 
-from .core.fs_ops import copy_and_verify, _format_bytes
+from .core.fs_ops import (
+    PHOTO_EXTENSIONS,
+    SCAN_WORKERS,
+    VERIFY_MODES,
+    VIDEO_EXTENSIONS,
+    copy_and_verify,
+    _copy_workers,
+    iter_files,
+    scan_files,
+    scan_media,
+    sync_filesystem,
+    _build_destination_index,
+    _format_bytes,
+    _index_dir,
+    _same_size_and_mtime,
+    _scan_dir,
+)
 from .core.patterns import _matches_pattern
 
 
+HASH_WORKERS = 4
+RESTORE_COPY_WORKERS = 4
+INDEX_NAME = ".vflow_index.sqlite"
+INDEX_VERSION = 3
+INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    dir TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    fingerprint TEXT,
+    checksum TEXT
+);
+CREATE INDEX IF NOT EXISTS files_size ON files(size);
+CREATE INDEX IF NOT EXISTS files_dir ON files(dir);
+CREATE TABLE IF NOT EXISTS dirs (
+    path TEXT PRIMARY KEY,
+    parent TEXT,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS dirs_parent ON dirs(parent);
+CREATE TEMP TABLE IF NOT EXISTS scan (
+    path TEXT PRIMARY KEY,
+    dir TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE TEMP TABLE IF NOT EXISTS scan_dirs (
+    path TEXT PRIMARY KEY,
+    parent TEXT,
+    mtime_ns INTEGER NOT NULL
+);
+"""
+# Directory mtimes this close to the scan may still change within the same
+# timestamp tick, so such directories are re-listed on the next run.
+RACY_MTIME_NS = 2_000_000_000
+FINGERPRINT_WINDOW = 64 * 1024
+
+
+def _checksum(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as source:
+        for chunk in iter(lambda: source.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _fingerprint(path: Path) -> str:
+    """
+    Hash of the size plus the first, middle and last 64 KiB of a file, so
+    same-size files that differ can usually be told apart without reading
+    them in full. Small files are hashed whole.
+    """
+    digest = hashlib.sha256()
+    with path.open("rb") as source:
+        size = os.fstat(source.fileno()).st_size
+        digest.update(str(size).encode("ascii"))
+        if size <= 3 * FINGERPRINT_WINDOW:
+            digest.update(source.read())
+        else:
+            middle = size // 2 - FINGERPRINT_WINDOW // 2
+            for offset in (0, middle, size - FINGERPRINT_WINDOW):
+                source.seek(offset)
+                digest.update(source.read(FINGERPRINT_WINDOW))
+    return digest.hexdigest()
+
+
+def _safe_checksum(path: str) -> Optional[str]:
+    try:
+        return _checksum(Path(path))
+    except OSError:
+        return None
+
+
+def _safe_fingerprint(path: str) -> Optional[str]:
+    try:
+        return _fingerprint(Path(path))
+    except OSError:
+        return None
+
+
+def _init_archive_index(connection: sqlite3.Connection) -> sqlite3.Connection:
+    (version,) = connection.execute("PRAGMA user_version").fetchone()
+    if version != INDEX_VERSION:
+        connection.executescript(
+            f"""
+            DROP TABLE IF EXISTS files;
+            DROP TABLE IF EXISTS dirs;
+            PRAGMA user_version = {INDEX_VERSION};
+            """
+        )
+    connection.executescript(INDEX_SCHEMA)
+    return connection
+
+
+def _open_archive_index(archive_path: Path, dry_run: bool) -> sqlite3.Connection:
+    """
+    Open the archive's persistent file index, or a throwaway one for dry runs
+    and read-only archives. Checksums survive between runs until a file's
+    size or mtime changes.
+    """
+    if not dry_run:
+        try:
+            connection = sqlite3.connect(str(archive_path / INDEX_NAME))
+            # The index is a rebuildable cache: trade fsyncs for speed.
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            return _init_archive_index(connection)
+        except sqlite3.Error:
+            pass
+    return _init_archive_index(sqlite3.connect(":memory:"))
+
+
+def _dir_mtime(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _refresh_archive_index(
+    connection: sqlite3.Connection, archive_path: Path
+) -> Iterator[None]:
+    """
+    Re-scan the archive into the index, yielding once per directory visited.
+    A directory whose mtime has not changed still holds the same entries, so
+    its rows are carried over without listing or stat-ing its files again.
+    Checksums are kept while a file's size and mtime are unchanged.
+    """
+    racy_after = time.time_ns() - RACY_MTIME_NS
+    pending: list[tuple[str, Optional[str]]] = [(str(archive_path), None)]
+    with connection, ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+        while pending:
+            mtimes = executor.map(_dir_mtime, [path for path, _ in pending])
+            next_pending: list[tuple[str, Optional[str]]] = []
+            changed: list[str] = []
+            for (path, parent), mtime_ns in zip(pending, mtimes):
+                if mtime_ns is None:
+                    continue
+                connection.execute(
+                    "INSERT INTO scan_dirs VALUES (?, ?, ?)",
+                    (path, parent, mtime_ns if mtime_ns < racy_after else -1),
+                )
+                known = connection.execute(
+                    "SELECT mtime_ns FROM dirs WHERE path = ?", (path,)
+                ).fetchone()
+                if known is None or known[0] != mtime_ns:
+                    changed.append(path)
+                    continue
+                connection.execute(
+                    "INSERT INTO scan SELECT path, dir, size, mtime_ns FROM files WHERE dir = ?",
+                    (path,),
+                )
+                next_pending.extend(
+                    (child, path)
+                    for (child,) in connection.execute(
+                        "SELECT path FROM dirs WHERE parent = ?", (path,)
+                    )
+                )
+                yield
+
+            for path, (entries, subdirs) in zip(
+                changed, executor.map(_scan_dir, changed)
+            ):
+                connection.executemany(
+                    "INSERT INTO scan VALUES (?, ?, ?, ?)",
+                    [
+                        (entry.path, path, entry.stat().st_size, entry.stat().st_mtime_ns)
+                        for entry in entries
+                        if "." in entry.name and not entry.name.startswith(INDEX_NAME)
+                    ],
+                )
+                next_pending.extend((child, path) for child in subdirs)
+                yield
+            pending = next_pending
+
+        connection.execute("DELETE FROM files WHERE path NOT IN (SELECT path FROM scan)")
+        connection.execute(
+            """
+            INSERT INTO files (path, dir, size, mtime_ns, fingerprint, checksum)
+            SELECT path, dir, size, mtime_ns, NULL, NULL FROM scan WHERE true
+            ON CONFLICT(path) DO UPDATE SET
+                fingerprint = CASE
+                    WHEN files.size = excluded.size AND files.mtime_ns = excluded.mtime_ns
+                    THEN files.fingerprint
+                END,
+                checksum = CASE
+                    WHEN files.size = excluded.size AND files.mtime_ns = excluded.mtime_ns
+                    THEN files.checksum
+                END,
+                dir = excluded.dir,
+                size = excluded.size,
+                mtime_ns = excluded.mtime_ns
+            """
+        )
+        connection.executescript(
+            """
+            DELETE FROM dirs;
+            INSERT INTO dirs SELECT path, parent, mtime_ns FROM scan_dirs;
+            DELETE FROM scan;
+            DELETE FROM scan_dirs;
+            """
+        )
+
+
+def _archive_sizes(connection: sqlite3.Connection) -> set[int]:
+    """Sizes present in the archive, so most new files skip the database entirely."""
+    return {size for (size,) in connection.execute("SELECT DISTINCT size FROM files")}
+
+
+def _fill_column(
+    connection: sqlite3.Connection, column: str, values: dict, compute
+) -> None:
+    """Compute missing per-path values on the hash pool and store them."""
+    missing = [path for path, value in values.items() if value is None]
+    if not missing:
+        return
+    with ThreadPoolExecutor(max_workers=HASH_WORKERS) as executor:
+        computed = list(zip(missing, executor.map(compute, missing)))
+    values.update(computed)
+    with connection:
+        connection.executemany(
+            f"UPDATE files SET {column} = ? WHERE path = ?",
+            [(value, path) for path, value in computed if value is not None],
+        )
+
+
+def _content_in_archive(connection: sqlite3.Connection, file: Path, size: int) -> bool:
+    """
+    Check whether the archive already holds a file with the same bytes.
+    Same-size archive files are first compared by sampled fingerprint; only
+    fingerprint matches are hashed in full, and each value is computed once.
+    A match is re-checked against the file on disk, since rows carried over
+    from an unchanged directory may predate an in-place edit.
+    """
+    candidates = connection.execute(
+        "SELECT path, fingerprint, checksum, mtime_ns FROM files WHERE size = ?",
+        (size,),
+    ).fetchall()
+    if not candidates:
+        return False
+
+    fingerprints = {path: fingerprint for path, fingerprint, _, _ in candidates}
+    _fill_column(connection, "fingerprint", fingerprints, _safe_fingerprint)
+    file_fingerprint = _fingerprint(file)
+    candidates = [row for row in candidates if fingerprints[row[0]] == file_fingerprint]
+    if not candidates:
+        return False
+
+    digests = {path: checksum for path, _, checksum, _ in candidates}
+    _fill_column(connection, "checksum", digests, _safe_checksum)
+    file_digest = _checksum(file)
+    for path, _, _, mtime_ns in candidates:
+        if digests[path] != file_digest:
+            continue
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        if stat.st_size == size and stat.st_mtime_ns == mtime_ns:
+            return True
+        with connection:
+            connection.execute(
+                "UPDATE files SET size = ?, mtime_ns = ?, fingerprint = NULL, "
+                "checksum = NULL WHERE path = ?",
+                (stat.st_size, stat.st_mtime_ns, path),
+            )
+        if stat.st_size == size and _safe_checksum(path) == file_digest:
+            return True
+    return False
+
+
+def _record_in_archive(connection: sqlite3.Connection, path: Path) -> None:
+    stat = path.stat()
+    with connection:
+        connection.execute(
+            "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, NULL, NULL)",
+            (str(path), str(path.parent), stat.st_size, stat.st_mtime_ns),
+        )
+
+
 def consolidate_files(
     source_dir: str,
     output_folder_name: Optional[str],
@@ -18,9 +320,11 @@ def consolidate_files(
     tags: Optional[str] = None,
     preserve_structure: bool = True,
     dry_run: bool = False,
+    verify: str = "none",
 ) -> None:
     """
     Finds unique files from a source directory and copies them to the archive.
+    verify selects how each copy is checked (see VERIFY_MODES).
     """
     source_path = Path(source_dir)
 
@@ -28,6 +332,13 @@ def consolidate_files(
         typer.echo(f"Source is not a valid directory: {source_path}", err=True)
         raise typer.Exit(code=1)
 
+    if verify not in VERIFY_MODES:
+        typer.echo(
+            f"Unknown verify mode '{verify}'. Choose one of: {', '.join(VERIFY_MODES)}.",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+
     if destination_path:
         output_path = archive_path / destination_path
     elif output_folder_name:
@@ -46,58 +357,53 @@ def consolidate_files(
             raise typer.Exit(code=1)
 
     typer.echo("Building index of existing archive files (this may take a moment)...")
-    archive_index: set[tuple[str, int]] = set()
-    all_archive_files = list(archive_path.rglob("*.*"))
-    with typer.progressbar(all_archive_files, label="Indexing archive") as progress:
-        for file in progress:
-            if file.is_file():
-                try:
-                    archive_index.add((file.name, file.stat().st_size))
-                except FileNotFoundError:
-                    continue
+    archive_index = _open_archive_index(archive_path, dry_run)
+    with typer.progressbar(
+        _refresh_archive_index(archive_index, archive_path), label="Indexing archive"
+    ) as progress:
+        for _ in progress:
+            pass
+    archive_sizes = _archive_sizes(archive_index)
 
-    video_extensions = {
-        ".mp4",
-        ".mov",
-        ".mxf",
-        ".mts",
-        ".avi",
-        ".m4v",
-        ".braw",
-        ".r3d",
-        ".crm",
-    }
     typer.echo("Scanning source directory...")
-    all_source_files = list(source_path.rglob("*.*"))
-    source_files = [
-        f
-        for f in all_source_files
-        if f.is_file() and f.suffix.lower() in video_extensions
-    ]
+    source_total = 0
+    source_stats: dict[Path, os.stat_result] = {}
+    for entry in iter_files(source_path):
+        if "." not in entry.name:
+            continue
+        source_total += 1
+        if os.path.splitext(entry.name)[1].lower() in VIDEO_EXTENSIONS:
+            source_stats[Path(entry.path)] = entry.stat()
+    source_files = list(source_stats)
 
     if file_filter:
         filtered_files: list[Path] = []
+        name_patterns: list[str] = []
         for pattern in file_filter:
             pattern_path = source_path / pattern
             if pattern_path.exists():
-                if pattern_path.is_file() and pattern_path.suffix.lower() in video_extensions:
+                if pattern_path.is_file() and os.path.splitext(pattern)[1].lower() in VIDEO_EXTENSIONS:
                     filtered_files.append(pattern_path)
                 elif pattern_path.is_dir():
-                    for file_path in pattern_path.rglob("*"):
-                        if file_path.is_file() and file_path.suffix.lower() in video_extensions:
+                    for entry in iter_files(pattern_path):
+                        if os.path.splitext(entry.name)[1].lower() in VIDEO_EXTENSIONS:
+                            file_path = Path(entry.path)
+                            source_stats.setdefault(file_path, entry.stat())
                             filtered_files.append(file_path)
             else:
-                for f in source_files:
-                    rel_path_str = str(f.relative_to(source_path))
-                    if (
-                        _matches_pattern(pattern, f.name)
-                        or _matches_pattern(pattern, rel_path_str)
-                        or any(
-                            _matches_pattern(pattern, part)
-                            for part in f.relative_to(source_path).parts
-                        )
-                    ):
-                        filtered_files.append(f)
+                name_patterns.append(pattern)
+        if name_patterns:
+            # One pass over the source files, testing every name pattern
+            # against the name, the relative path and each path component.
+            for f in source_files:
+                rel_path = f.relative_to(source_path)
+                candidates = (f.name, str(rel_path), *rel_path.parts)
+                if any(
+                    _matches_pattern(pattern, candidate)
+                    for pattern in name_patterns
+                    for candidate in candidates
+                ):
+                    filtered_files.append(f)
         source_files = list(dict.fromkeys(filtered_files))
 
         if not source_files:
@@ -105,12 +411,12 @@ def consolidate_files(
                 f"⚠ No files found matching filter: {', '.join(file_filter)}", err=True
             )
             typer.echo(
-                f"   Searched {len(all_source_files)} file(s) in: {source_path}"
+                f"   Searched {source_total} file(s) in: {source_path}"
             )
             raise typer.Exit(code=1)
 
         typer.echo(
-            f"Found {len(source_files)} file(s) matching filter (out of {len([f for f in all_source_files if f.is_file()])} total)."
+            f"Found {len(source_files)} file(s) matching filter (out of {source_total} total)."
         )
     else:
         typer.echo(f"Found {len(source_files)} video file(s) to process.")
@@ -133,18 +439,19 @@ def consolidate_files(
                     else:
                         dest_file = output_path / file.name
 
-                    file_id = (file.name, file.stat().st_size)
+                    file_stat = source_stats.get(file) or file.stat()
+                    file_size = file_stat.st_size
 
-                    if file_id in archive_index:
+                    if file_size in archive_sizes and _content_in_archive(
+                        archive_index, file, file_size
+                    ):
                         skipped_count += 1
                         typer.echo(f"SKIP (already in archive): {file}")
                         continue
 
                     if dest_file.exists():
                         try:
-                            source_size = file.stat().st_size
-                            dest_size = dest_file.stat().st_size
-                            if source_size == dest_size:
+                            if _same_size_and_mtime(dest_file.stat(), file_stat):
                                 skipped_count += 1
                                 typer.echo(
                                     f"SKIP (already at destination): {file}"
@@ -168,73 +475,151 @@ def consolidate_files(
         typer.echo(f"{skipped_count} file(s) would be skipped as duplicates.")
         if error_count > 0:
             typer.echo(f"Errors during analysis: {error_count}", err=True)
+        archive_index.close()
         return
 
     copied_log_path = output_path / "copied_files.txt"
     skipped_log_path = output_path / "skipped_duplicates.txt"
 
-    with copied_log_path.open("w") as copied_log, skipped_log_path.open(
-        "w"
-    ) as skipped_log:
-        with typer.progressbar(source_files, label="Consolidating") as progress:
-            for file in progress:
-                try:
-                    if preserve_structure:
-                        rel_path = file.relative_to(source_path)
-                        dest_file = output_path / rel_path
-                        dest_dir = dest_file.parent
-                    else:
-                        dest_file = output_path / file.name
-                        dest_dir = output_path
+    copied_entries: list[str] = []
+    skipped_entries: list[str] = []
+    created_dirs: set[Path] = set()
 
-                    dest_dir.mkdir(parents=True, exist_ok=True)
+    def copy_and_tag(file: Path, dest_dir: Path, dest_file: Path) -> tuple:
+        if not copy_and_verify(file, dest_dir, verify):
+            return False, None
+        if tags:
+            from .core.media_ops import tag_media_file
 
-                    file_id = (file.name, file.stat().st_size)
-                    if file_id in archive_index:
-                        skipped_log.write(f"{file}\n")
-                        skipped_count += 1
-                        continue
+            try:
+                tag_media_file(dest_file, tags, dest_file)
+            except Exception as e:
+                return True, e
+        return True, None
+
+    # Sources copied this run, by size. Tagging rewrites the archive copy, so
+    # its index row no longer matches the source's bytes; a later identical
+    # source is compared with these instead.
+    copied_sources: dict[int, list[Path]] = {}
+    source_digests: dict[Path, str] = {}
+
+    def copied_this_run(file: Path, file_size: int) -> bool:
+        earlier = copied_sources.get(file_size)
+        if not earlier:
+            return False
+        for path in (file, *earlier):
+            if path not in source_digests:
+                source_digests[path] = _checksum(path)
+        return any(source_digests[path] == source_digests[file] for path in earlier)
+
+    # Copies run on a pool; decisions stay in source order on this thread.
+    # A file whose size or destination matches a copy still in flight waits
+    # for it, so the archive index has seen every earlier same-size copy.
+    pending: dict[Future, tuple[Path, Path, int]] = {}
+    pending_sizes: dict[int, list[Future]] = {}
+    pending_targets: dict[Path, Future] = {}
+
+    def finish(future: Future) -> None:
+        nonlocal copied_count, error_count
+        file, dest_file, file_size = pending.pop(future)
+        pending_sizes[file_size].remove(future)
+        if pending_targets.get(dest_file) is future:
+            del pending_targets[dest_file]
+        copied, tag_error = future.result()
+        if not copied:
+            error_count += 1
+        else:
+            copied_entries.append(f"{file}\n")
+            copied_count += 1
+            if tags:
+                copied_sources.setdefault(file_size, []).append(file)
+            try:
+                _record_in_archive(archive_index, dest_file)
+                archive_sizes.add(file_size)
+            except OSError as e:
+                typer.echo(f"\n[ERROR] Could not index {dest_file.name}: {e}", err=True)
+            if tag_error is not None:
+                typer.echo(
+                    f"\n⚠ Warning: Could not tag {dest_file.name}: {tag_error}",
+                    err=True,
+                )
+        progress.update(1)
+
+    def wait_for(futures: list) -> None:
+        for future in list(futures):
+            if future in pending:
+                future.result()
+                finish(future)
+
+    workers = _copy_workers(source_path, output_path)
+    with typer.progressbar(
+        length=len(source_files), label="Consolidating"
+    ) as progress, ThreadPoolExecutor(max_workers=workers) as executor:
+        for file in source_files:
+            for future in [future for future in pending if future.done()]:
+                finish(future)
+            try:
+                if preserve_structure:
+                    rel_path = file.relative_to(source_path)
+                    dest_file = output_path / rel_path
+                    dest_dir = dest_file.parent
+                else:
+                    dest_file = output_path / file.name
+                    dest_dir = output_path
 
-                    if dest_file.exists():
-                        try:
-                            source_size = file.stat().st_size
-                            dest_size = dest_file.stat().st_size
-                            if source_size == dest_size:
-                                skipped_log.write(f"{file}\n")
-                                skipped_count += 1
-                                continue
-                        except Exception:
-                            pass
+                if dest_dir not in created_dirs:
+                    dest_dir.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(dest_dir)
+
+                file_stat = source_stats.get(file) or file.stat()
+                file_size = file_stat.st_size
+                wait_for(pending_sizes.get(file_size, []))
+                if dest_file in pending_targets:
+                    wait_for([pending_targets[dest_file]])
+
+                if (
+                    file_size in archive_sizes
+                    and _content_in_archive(archive_index, file, file_size)
+                ) or copied_this_run(file, file_size):
+                    skipped_entries.append(f"{file}\n")
+                    skipped_count += 1
+                    progress.update(1)
+                    continue
 
-                    if copy_and_verify(file, dest_dir):
-                        copied_log.write(f"{file}\n")
-                        archive_index.add(file_id)
-                        copied_count += 1
+                if dest_file.exists():
+                    try:
+                        if _same_size_and_mtime(dest_file.stat(), file_stat):
+                            skipped_entries.append(f"{file}\n")
+                            skipped_count += 1
+                            progress.update(1)
+                            continue
+                    except Exception:
+                        pass
 
-                        if tags:
-                            from .core.media_ops import tag_media_file
+                future = executor.submit(copy_and_tag, file, dest_dir, dest_file)
+                pending[future] = (file, dest_file, file_size)
+                pending_sizes.setdefault(file_size, []).append(future)
+                pending_targets[dest_file] = future
 
-                            try:
-                                tagged_file = tag_media_file(dest_file, tags)
-                                from shutil import move
+            except FileNotFoundError:
+                progress.update(1)
+                continue
+            except Exception as e:
+                typer.echo(
+                    f"\n[ERROR] Could not process {file.name}: {e}", err=True
+                )
+                error_count += 1
+                progress.update(1)
 
-                                move(str(tagged_file), str(dest_file))
-                            except Exception as e:
-                                typer.echo(
-                                    f"\n⚠ Warning: Could not tag {dest_file.name}: {e}",
-                                    err=True,
-                                )
+        for future in as_completed(list(pending)):
+            finish(future)
 
-                    else:
-                        error_count += 1
+    copied_log_path.write_text("".join(copied_entries))
+    skipped_log_path.write_text("".join(skipped_entries))
 
-                except FileNotFoundError:
-                    continue
-                except Exception as e:
-                    typer.echo(
-                        f"\n[ERROR] Could not process {file.name}: {e}", err=True
-                    )
-                    error_count += 1
+    archive_index.close()
+    if copied_count:
+        sync_filesystem(output_path)
 
     typer.echo("\nConsolidation complete.")
     typer.echo(f"{copied_count} unique files copied.")
@@ -429,71 +814,94 @@ def restore_folder(
         f"  Overwrite:   {'yes' if overwrite else 'no (skip different existing files)'}"
     )
 
-    files = [f for f in source_path.rglob("*") if f.is_file()]
+    source_sizes = {
+        Path(entry.path): entry.stat().st_size for entry in scan_files(source_path)
+    }
+    files = sorted(source_sizes)
 
     if not files:
         typer.echo("No files found in source directory.")
         return
 
+    # One walk of the destination answers every "already there?" question.
+    dest_sizes = {
+        Path(entry.path): entry.stat().st_size for entry in scan_files(dest_path)
+    }
+
     copied = 0
     skipped = 0
     conflicts = 0
     errors = 0
 
-    with typer.progressbar(files, label="Restoring") as progress:
-        for src in progress:
-            try:
-                rel = src.relative_to(source_path)
-                dest_file = dest_path / rel
-                dest_dir_path = dest_file.parent
+    # Decide every file first (these checks are cheap and print in order),
+    # then overlap the copies themselves.
+    to_copy: list[tuple[Path, Path]] = []
+    created_dirs: set[Path] = set()
+    for src in files:
+        try:
+            rel = src.relative_to(source_path)
+            dest_file = dest_path / rel
+            dest_dir_path = dest_file.parent
+            if dest_dir_path not in created_dirs:
                 dest_dir_path.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(dest_dir_path)
 
-                src_size = src.stat().st_size
-
-                if dest_file.exists():
-                    try:
-                        dest_size = dest_file.stat().st_size
-                    except (OSError, FileNotFoundError):
-                        dest_size = -1
-
-                    if dest_size == src_size:
-                        skipped += 1
-                        continue
-
-                    if not overwrite:
-                        conflicts += 1
-                        typer.echo(
-                            f"\nConflict (sizes differ, not overwriting): {rel} "
-                            f"({src_size} -> {dest_size})"
-                        )
-                        continue
+            src_size = source_sizes[src]
+            dest_size = dest_sizes.get(dest_file)
+            if dest_size is None:
+                # The scan does not descend into symlinked directories.
+                try:
+                    dest_size = dest_file.stat().st_size
+                except FileNotFoundError:
+                    pass
 
-                    if dry_run:
-                        copied += 1
-                        typer.echo(f"\nWOULD OVERWRITE: {rel}")
-                        continue
+            if dest_size is not None:
+                if dest_size == src_size:
+                    skipped += 1
+                    continue
 
-                    if copy_and_verify(src, dest_dir_path):
-                        copied += 1
-                    else:
-                        errors += 1
+                if not overwrite:
+                    conflicts += 1
+                    typer.echo(
+                        f"\nConflict (sizes differ, not overwriting): {rel} "
+                        f"({src_size} -> {dest_size})"
+                    )
                     continue
 
                 if dry_run:
                     copied += 1
-                    typer.echo(f"\nWOULD COPY: {rel}")
+                    typer.echo(f"\nWOULD OVERWRITE: {rel}")
                     continue
 
-                if copy_and_verify(src, dest_dir_path):
+                to_copy.append((src, dest_dir_path))
+                continue
+
+            if dry_run:
+                copied += 1
+                typer.echo(f"\nWOULD COPY: {rel}")
+                continue
+
+            to_copy.append((src, dest_dir_path))
+
+        except Exception as e:
+            errors += 1
+            typer.echo(
+                f"\n[ERROR] Could not process {src}: {e}", err=True
+            )
+
+    with typer.progressbar(length=len(files), label="Restoring") as progress:
+        progress.update(len(files) - len(to_copy))
+        with ThreadPoolExecutor(max_workers=RESTORE_COPY_WORKERS) as executor:
+            futures = [
+                executor.submit(copy_and_verify, src, dest_dir_path)
+                for src, dest_dir_path in to_copy
+            ]
+            for future in as_completed(futures):
+                if future.result():
                     copied += 1
                 else:
                     errors += 1
-
-            except Exception as e:
-                errors += 1
-                typer.echo(
-                    f"\n[ERROR] Could not process {src}: {e}", err=True
-                )
+                progress.update(1)
 
     typer.echo("\nRestore summary")
     typer.echo("---------------")
@@ -525,9 +933,6 @@ def card_verify(
     video_folder = source_path / "private" / "M4ROOT" / "CLIP"
     photo_folder = source_path / "DCIM" / "100MSDCF"
 
-    video_extensions = {".mp4", ".mov", ".mxf", ".mts", ".avi", ".m4v", ".braw", ".r3d", ".crm"}
-    photo_extensions = {".arw", ".cr2", ".cr3", ".nef", ".dng", ".orf", ".rw2"}
-
     has_videos = video_folder.exists() and video_folder.is_dir()
     has_photos = photo_folder.exists() and photo_folder.is_dir()
 
@@ -540,29 +945,14 @@ def card_verify(
 
     # VIDEO VERIFICATION
     if has_videos:
-        video_files: list[Path] = [
-            f for f in video_folder.rglob("*")
-            if f.is_file() and f.suffix.lower() in video_extensions
-        ]
+        video_files = scan_media(video_folder, VIDEO_EXTENSIONS)
 
         archive_video_raw = archive_path / "Video" / "RAW"
-        archive_video_index: set[tuple[str, int]] = set()
-        if archive_video_raw.exists():
-            for f in archive_video_raw.rglob("*"):
-                if f.is_file() and f.suffix.lower() in video_extensions:
-                    try:
-                        archive_video_index.add((f.name, f.stat().st_size))
-                    except (OSError, FileNotFoundError):
-                        pass
+        archive_video_index = _build_destination_index(archive_video_raw)
 
         missing_videos: list[str] = []
-        for f in video_files:
-            try:
-                key = (f.name, f.stat().st_size)
-            except (OSError, FileNotFoundError):
-                missing_videos.append(f.name)
-                continue
-            if key not in archive_video_index:
+        for f, stat in video_files:
+            if (f.name, stat.st_size) not in archive_video_index:
                 missing_videos.append(f.name)
 
         video_pass = len(missing_videos) == 0
@@ -588,32 +978,21 @@ def card_verify(
         if not photo_shoot:
             typer.echo("\nPHOTOS  — skipped (no --photo-shoot provided)")
         else:
-            photo_files: list[Path] = [
-                f for f in photo_folder.rglob("*")
-                if f.is_file() and f.suffix.lower() in photo_extensions
-            ]
+            photo_files = scan_media(photo_folder, PHOTO_EXTENSIONS)
 
             shoot_photo_dir = archive_path / "Photo" / "RAW" / photo_shoot
             shoot_photo_index: set[tuple[str, int]] = set()
             if shoot_photo_dir.exists():
-                for f in shoot_photo_dir.iterdir():
-                    if f.is_file() and f.suffix.lower() in photo_extensions:
-                        try:
-                            shoot_photo_index.add((f.name, f.stat().st_size))
-                        except (OSError, FileNotFoundError):
-                            pass
+                shoot_photo_index = set(
+                    _index_dir(shoot_photo_dir, PHOTO_EXTENSIONS).items()
+                )
             else:
                 typer.echo(f"\nPHOTOS  — shoot folder not found: {shoot_photo_dir}", err=True)
                 overall_pass = False
 
             missing_photos: list[str] = []
-            for f in photo_files:
-                try:
-                    key = (f.name, f.stat().st_size)
-                except (OSError, FileNotFoundError):
-                    missing_photos.append(f.name)
-                    continue
-                if key not in shoot_photo_index:
+            for f, stat in photo_files:
+                if (f.name, stat.st_size) not in shoot_photo_index:
                     missing_photos.append(f.name)
 
             photo_pass = len(missing_photos) == 0
@@ -649,28 +1028,11 @@ def list_duplicates(
     """
     import time
 
-    video_extensions = {
-        ".mp4",
-        ".mov",
-        ".mxf",
-        ".mts",
-        ".avi",
-        ".m4v",
-        ".braw",
-        ".r3d",
-        ".crm",
-    }
     cutoff = (time.time() - max_age_hours * 3600) if max_age_hours else None
     by_key: dict[tuple[str, int], list[Path]] = {}
-    for f in root.rglob("*"):
-        if f.is_file() and f.suffix.lower() in video_extensions:
-            try:
-                st = f.stat()
-                if cutoff is not None and st.st_mtime < cutoff:
-                    continue
-                key = (f.name, st.st_size)
-                by_key.setdefault(key, []).append(f)
-            except (OSError, FileNotFoundError):
-                pass
+    for f, st in scan_media(root, VIDEO_EXTENSIONS):
+        if cutoff is not None and st.st_mtime < cutoff:
+            continue
+        by_key.setdefault((f.name, st.st_size), []).append(f)
     return [(key, paths) for key, paths in by_key.items() if len(paths) > 1]
 
@@ -10,7 +10,7 @@ from typing import Optional
 import typer
 
 from . import config
-from .core.fs_ops import _format_bytes
+from .core.fs_ops import _format_bytes, copy_file
 from .import_batch import CONTENTS_DIRECTORY, MANIFEST_NAME
 
 
@@ -176,7 +176,7 @@ def _copy_verified(entry: dict) -> str:
     destination.parent.mkdir(parents=True, exist_ok=True)
     temporary = destination.with_name(f".{destination.name}.vflow-part")
     try:
-        shutil.copy2(source, temporary)
+        copy_file(source, temporary)
         if _checksum(temporary, entry["algorithm"]) != entry["checksum"]:
             raise ValueError(f"Working Copy checksum verification failed for {source}")
         os.replace(temporary, destination)
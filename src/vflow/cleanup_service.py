@@ -12,8 +12,12 @@ from .resolve_adapter import ResolveAdapter
 
 
 def _is_within(path: Path, directory: Path) -> bool:
+    return _is_under_resolved(path, directory.resolve(strict=False))
+
+
+def _is_under_resolved(path: Path, resolved_directory: Path) -> bool:
     try:
-        path.resolve(strict=False).relative_to(directory.resolve(strict=False))
+        path.resolve(strict=False).relative_to(resolved_directory)
         return True
     except ValueError:
         return False
@@ -139,10 +143,13 @@ def delete_working_copy(plan: dict) -> dict:
     """Delete only the manifest-backed files in a prepared Cleanup plan."""
     deleted = 0
     failures = []
+    # The Archive root does not move during a deletion; each file path is
+    # still resolved on its own right before it is unlinked.
+    archive_root = plan["archive_root"].resolve(strict=False)
     for item in plan["files"]:
         path = item["working"]
         try:
-            if _is_within(path, plan["archive_root"]):
+            if _is_under_resolved(path, archive_root):
                 raise ValueError(
                     f"Archive safety gate failed immediately before deletion: {path}"
                 )
@@ -1,25 +1,73 @@
+import copy
+import hashlib
+import json
+import os
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import typer
-import yaml
 
+from . import __version__
 
 CONFIG_PATH = Path.home() / ".vflow_config.yml"
 CONFIG_VERSION = 2
 DEFAULT_LAPTOP_FREE_SPACE_RESERVE_GB = 50
 
+# Validated configuration per path, with the file bytes it was parsed from.
+_CONFIG_CACHE: Dict[Path, Tuple[bytes, dict]] = {}
 
-def load_config() -> dict:
-    """Load role-based storage configuration."""
-    if not CONFIG_PATH.exists():
-        typer.echo(f"Configuration file not found at: {CONFIG_PATH}")
-        typer.echo("Create it with 'v-flow make-config'.")
-        raise typer.Exit(code=1)
 
+def _parsed_cache_path() -> Path:
+    return CONFIG_PATH.with_name(f"{CONFIG_PATH.name}.cache.json")
+
+
+def _parsed_cache_key(digest: str) -> Dict[str, Any]:
+    # The validation rules can change between releases, so a config parsed
+    # by another version of v-flow is checked again rather than trusted.
+    return {
+        "source_sha256": digest,
+        "config_version": CONFIG_VERSION,
+        "vflow_version": __version__,
+    }
+
+
+def _read_parsed_cache(digest: str) -> Optional[dict]:
+    try:
+        cached = json.loads(_parsed_cache_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict):
+        return None
+    if any(cached.get(key) != value for key, value in _parsed_cache_key(digest).items()):
+        return None
+    loaded = cached.get("config")
+    return loaded if isinstance(loaded, dict) else None
+
+
+def _write_parsed_cache(digest: str, loaded: dict) -> None:
+    # Only configs that survive a JSON round trip unchanged are cached; YAML
+    # dates or non-string keys would come back different.
+    try:
+        if json.loads(json.dumps(loaded)) != loaded:
+            return
+        cache_path = _parsed_cache_path()
+        temporary = cache_path.with_name(f".{cache_path.name}.vflow-part")
+        temporary.write_text(
+            json.dumps({**_parsed_cache_key(digest), "config": loaded}),
+            encoding="utf-8",
+        )
+        os.replace(temporary, cache_path)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def _parse_config(raw: bytes) -> dict:
+    import yaml
+
+    # libyaml's C loader when PyYAML was built with it; same safe schema.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     try:
-        with CONFIG_PATH.open("r") as config_file:
-            loaded = yaml.safe_load(config_file)
+        loaded = yaml.load(raw, Loader=loader)
     except yaml.YAMLError as error:
         typer.echo(f"Error parsing configuration file: {error}", err=True)
         raise typer.Exit(code=1)
@@ -52,6 +100,31 @@ def load_config() -> dict:
     return loaded
 
 
+def load_config() -> dict:
+    """
+    Load role-based storage configuration. A validated copy is kept as JSON
+    beside the file, keyed on its SHA-256 and on the v-flow and config
+    versions, so later runs skip importing and running the YAML parser until
+    the file or v-flow changes. Within a process the parsed file is cached
+    too; callers get their own copy to modify.
+    """
+    if not CONFIG_PATH.exists():
+        typer.echo(f"Configuration file not found at: {CONFIG_PATH}")
+        typer.echo("Create it with 'v-flow make-config'.")
+        raise typer.Exit(code=1)
+
+    raw = CONFIG_PATH.read_bytes()
+    cached = _CONFIG_CACHE.get(CONFIG_PATH)
+    if cached is None or cached[0] != raw:
+        digest = hashlib.sha256(raw).hexdigest()
+        loaded = _read_parsed_cache(digest)
+        if loaded is None:
+            loaded = _parse_config(raw)
+            _write_parsed_cache(digest, loaded)
+        cached = _CONFIG_CACHE[CONFIG_PATH] = (raw, loaded)
+    return copy.deepcopy(cached[1])
+
+
 def resolve_location(app_config: dict, name: str) -> Optional[str]:
     """Resolve an Archive, Exports, or named Working Location path."""
     locations = app_config.get("locations", {})
@@ -85,10 +158,13 @@ def get_setting(app_config: dict, key: str, default: Any = None) -> Any:
 
 def save_config(app_config: dict) -> None:
     """Write configuration to its configured persistent path."""
+    import yaml
+
     with CONFIG_PATH.open("w") as config_file:
-        yaml.safe_dump(
+        yaml.dump(
             app_config,
             config_file,
+            Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
             default_flow_style=False,
             sort_keys=False,
             allow_unicode=True,
@@ -1,10 +1,25 @@
 from __future__ import annotations
 
 from datetime import date, datetime
+from functools import lru_cache
+from operator import itemgetter
 from typing import Optional, Tuple
 import re
 
 
+# YYYY-MM-DD_ShootName, or YYYY-MM-DD_to_YYYY-MM-DD_ShootName for a range.
+_SHOOT_DATE_RE = re.compile(
+    r"^(\d{4}-\d{2}-\d{2})(?:_to_(\d{4}-\d{2}-\d{2}))?_(.+)$"
+)
+
+
+def _iso_date(text: str) -> date:
+    # The patterns already guarantee YYYY-MM-DD digits; date() rejects
+    # out-of-range months and days with ValueError, as strptime did.
+    return date(int(text[:4]), int(text[5:7]), int(text[8:10]))
+
+
+@lru_cache(maxsize=4096)
 def parse_shoot_date_range(shoot_name: str) -> Optional[Tuple[date, date]]:
     """
     Parse a shoot name to extract date range.
@@ -14,28 +29,21 @@ def parse_shoot_date_range(shoot_name: str) -> Optional[Tuple[date, date]]:
     - YYYY-MM-DD_ShootName (single date)
     - YYYY-MM-DD_to_YYYY-MM-DD_ShootName (date range)
     """
-    # Pattern for date range: YYYY-MM-DD_to_YYYY-MM-DD_ShootName
-    range_pattern = r"^(\d{4}-\d{2}-\d{2})_to_(\d{4}-\d{2}-\d{2})_(.+)$"
-    match = re.match(range_pattern, shoot_name)
-    if match:
+    match = _SHOOT_DATE_RE.match(shoot_name)
+    if not match:
+        return None
+    try:
+        start = _iso_date(match.group(1))
+    except ValueError:
+        return None
+
+    # An invalid end date reads as a single-date shoot, as it always has.
+    if match.group(2):
         try:
-            start = datetime.strptime(match.group(1), "%Y-%m-%d").date()
-            end = datetime.strptime(match.group(2), "%Y-%m-%d").date()
-            return (start, end)
+            return (start, _iso_date(match.group(2)))
         except ValueError:
             pass
-
-    # Pattern for single date: YYYY-MM-DD_ShootName
-    single_pattern = r"^(\d{4}-\d{2}-\d{2})_(.+)$"
-    match = re.match(single_pattern, shoot_name)
-    if match:
-        try:
-            shoot_date = datetime.strptime(match.group(1), "%Y-%m-%d").date()
-            return (shoot_date, shoot_date)
-        except ValueError:
-            pass
-
-    return None
+    return (start, start)
 
 
 def format_shoot_name(
@@ -73,42 +81,28 @@ def cluster_files_by_date(
         return []
 
     # Sort by date
-    sorted_files = sorted(files_with_dates, key=lambda x: x[1])
-
-    clusters: list[list[object]] = []
-    current_cluster: list[object] = []
-
-    if not sorted_files:
-        return []
-
-    # Start first cluster
-    current_cluster.append(sorted_files[0][0])
-    last_date = sorted_files[0][1]
-
-    for i in range(1, len(sorted_files)):
-        file_path, file_date = sorted_files[i]
-
-        # Calculate difference in hours
-        # Ensure we are comparing datetimes
-        if isinstance(file_date, date) and not isinstance(file_date, datetime):
-            # Fallback if we only have dates (assume midnight)
-            file_date = datetime.combine(file_date, datetime.min.time())
-        if isinstance(last_date, date) and not isinstance(last_date, datetime):
-            last_date = datetime.combine(last_date, datetime.min.time())
-
-        diff = file_date - last_date
-        diff_hours = diff.total_seconds() / 3600
-
-        if diff_hours >= gap_hours:
-            # Gap exceeded, start new cluster
-            clusters.append(current_cluster)
-            current_cluster = []
-
-        current_cluster.append(file_path)
-        last_date = file_date
-
-    if current_cluster:
-        clusters.append(current_cluster)
-
-    return clusters
-
+    sorted_files = sorted(files_with_dates, key=itemgetter(1))
+
+    # Compare datetimes throughout; plain dates count as midnight.
+    dates = [
+        file_date
+        if isinstance(file_date, datetime)
+        else datetime.combine(file_date, datetime.min.time())
+        for _, file_date in sorted_files
+    ]
+
+    # Whole seconds suffice: a gap reaches gap_seconds exactly when its
+    # whole-second part does.
+    gap_seconds = gap_hours * 3600
+    gaps = [later - earlier for earlier, later in zip(dates, dates[1:])]
+    splits = [
+        index
+        for index, gap in enumerate(gaps, 1)
+        if gap.days * 86400 + gap.seconds >= gap_seconds
+    ]
+
+    boundaries = [0, *splits, len(sorted_files)]
+    return [
+        [file_path for file_path, _ in sorted_files[start:end]]
+        for start, end in zip(boundaries, boundaries[1:])
+    ]
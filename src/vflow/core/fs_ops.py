@@ -1,16 +1,279 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Set, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
+import ctypes
+import errno
+import hashlib
+import os
 import shutil
+import sys
 import typer
 
 
-def copy_and_verify(source: Path, dest: Path) -> bool:
-    """Copies a file and verifies its existence."""
+VIDEO_EXTENSIONS = frozenset(
+    {".mp4", ".mov", ".mxf", ".mts", ".avi", ".m4v", ".braw", ".r3d", ".crm"}
+)
+PHOTO_EXTENSIONS = frozenset({".arw", ".cr2", ".cr3", ".nef", ".dng", ".orf", ".rw2"})
+SCAN_WORKERS = 16
+VERIFY_MODES = ("none", "size", "sha256")
+VERIFY_BLOCK_SIZE = 4 * 1024 * 1024
+MTIME_TOLERANCE_NS = 2_000_000_000
+COPY_BUFSIZE = 1024 * 1024
+CROSS_DEVICE_COPY_WORKERS = 8
+SAME_DEVICE_COPY_WORKERS = 2
+FALLOC_FL_KEEP_SIZE = 0x01
+# Errors meaning a kernel copy path is unavailable for these two files, so
+# the next path is tried. Any other error (EIO from a failing card, ENOSPC)
+# is raised, as shutil does, instead of repeating the copy another way.
+KERNEL_COPY_FALLBACK_ERRNOS = frozenset(
+    {
+        errno.ENOSYS,
+        errno.EXDEV,
+        errno.EINVAL,
+        errno.EOPNOTSUPP,
+        errno.ENOTSUP,
+        errno.EBADF,
+        errno.ETXTBSY,
+    }
+)
+
+
+@lru_cache(maxsize=None)
+def _libc_function(name: str, *argtypes):
+    """
+    Look a C library function up once per process and declare its signature,
+    returning None where the platform does not provide it.
+    """
+    library = "/usr/lib/libSystem.dylib" if sys.platform == "darwin" else None
+    try:
+        function = getattr(ctypes.CDLL(library, use_errno=True), name)
+    except (AttributeError, OSError):
+        return None
+    function.argtypes = list(argtypes)
+    function.restype = ctypes.c_int
+    return function
+
+
+def _clone_file(source: Path, destination: Path) -> bool:
+    clonefile = _libc_function(
+        "clonefile", ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32
+    )
+    if clonefile is None:
+        return False
+    return clonefile(os.fsencode(source), os.fsencode(destination), 0) == 0
+
+
+def _advise(fd: int, advice: str) -> None:
+    # Source pages of a one-pass media copy are never re-read; reading them
+    # sequentially and dropping them afterwards keeps the page cache for
+    # the tagging and indexing work that follows.
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, getattr(os, advice))
+        except OSError:
+            pass
+
+
+def _fallocate_function():
+    argtypes = (ctypes.c_int, ctypes.c_int, ctypes.c_int64, ctypes.c_int64)
+    return _libc_function("fallocate64", *argtypes) or _libc_function(
+        "fallocate", *argtypes
+    )
+
+
+def _preallocate(src_fd: int, dst_fd: int) -> None:
+    # Reserving the whole size up front lets the filesystem lay a large clip
+    # out contiguously instead of extending it block by block. KEEP_SIZE
+    # leaves st_size at the bytes actually written, so a copy that fails
+    # part way stays short and every size check still catches it.
+    # fallocate(2) itself, not posix_fallocate: glibc emulates the latter by
+    # writing every block on exFAT, NFS or SMB, doubling the copy's writes,
+    # where the syscall just fails with EOPNOTSUPP.
+    size = os.fstat(src_fd).st_size
+    fallocate = _fallocate_function()
+    if size and fallocate is not None:
+        fallocate(dst_fd, FALLOC_FL_KEEP_SIZE, 0, size)
+
+
+def _copied_whole(src_fd: int, copied: int) -> bool:
+    # Some filesystems (procfs, and FUSE, NFS or CIFS on some kernels) answer
+    # copy_file_range or sendfile with 0 instead of an error. Treat nothing
+    # copied, or less than the whole source, as refused so a slower path
+    # copies the file again rather than leaving it silently short.
+    return copied > 0 and copied == os.fstat(src_fd).st_size
+
+
+def _copy_file_range(source: Path, destination: Path) -> Optional[int]:
+    try:
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            _advise(src.fileno(), "POSIX_FADV_SEQUENTIAL")
+            offset = 0
+            while True:
+                copied = os.copy_file_range(src.fileno(), dst.fileno(), 1 << 30)
+                if not copied:
+                    break
+                offset += copied
+            _advise(src.fileno(), "POSIX_FADV_DONTNEED")
+            if not _copied_whole(src.fileno(), offset):
+                return None
+            return os.fstat(dst.fileno()).st_size
+    except OSError as error:
+        if error.errno in KERNEL_COPY_FALLBACK_ERRNOS:
+            return None
+        raise
+
+
+def _sendfile_copy(source: Path, destination: Path) -> Optional[int]:
+    try:
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            _advise(src.fileno(), "POSIX_FADV_SEQUENTIAL")
+            _preallocate(src.fileno(), dst.fileno())
+            offset = 0
+            while True:
+                sent = os.sendfile(dst.fileno(), src.fileno(), offset, 1 << 30)
+                if not sent:
+                    break
+                offset += sent
+            os.ftruncate(dst.fileno(), offset)
+            _advise(src.fileno(), "POSIX_FADV_DONTNEED")
+            if not _copied_whole(src.fileno(), offset):
+                return None
+            return os.fstat(dst.fileno()).st_size
+    except OSError as error:
+        if error.errno in KERNEL_COPY_FALLBACK_ERRNOS:
+            return None
+        raise
+
+
+def _buffered_copy(source: Path, destination: Path) -> int:
+    with open(source, "rb", buffering=0) as src, open(destination, "wb") as dst:
+        _advise(src.fileno(), "POSIX_FADV_SEQUENTIAL")
+        _preallocate(src.fileno(), dst.fileno())
+        shutil.copyfileobj(src, dst, COPY_BUFSIZE)
+        dst.flush()
+        os.ftruncate(dst.fileno(), dst.tell())
+        _advise(src.fileno(), "POSIX_FADV_DONTNEED")
+        return os.fstat(dst.fileno()).st_size
+
+
+def copy_file(
+    source: Path, destination: Path, preserve_metadata: bool = True
+) -> int:
+    """
+    Copy one file's bytes, and by default its timestamps and mode, to an exact
+    destination path. Every service copies through here so faster copy paths
+    apply everywhere: clonefile on macOS and copy_file_range (then sendfile)
+    on Linux keep the bytes in the kernel (or share blocks outright). When
+    those are refused, Linux falls back to a COPY_BUFSIZE buffered copy and
+    other platforms to shutil.copyfile (fcopyfile on macOS). Timestamps
+    drive shoot dating, so only skip them for copies that are rewritten
+    straight afterwards. Returns the size of the copy, read from the open
+    destination where the copy path allows.
+    """
+    # The Linux paths truncate the destination before reading the source.
     try:
-        shutil.copy2(source, dest)
-        if not (dest / source.name).exists():
+        same_file = os.path.samefile(source, destination)
+    except OSError:
+        same_file = False
+    if same_file:
+        raise shutil.SameFileError(f"{source!r} and {destination!r} are the same file")
+
+    size: Optional[int] = None
+    if sys.platform == "darwin":
+        if _clone_file(source, destination):
+            size = os.stat(destination).st_size
+    elif sys.platform.startswith("linux"):
+        if hasattr(os, "copy_file_range"):
+            size = _copy_file_range(source, destination)
+        if size is None:
+            size = _sendfile_copy(source, destination)
+        if size is None:
+            size = _buffered_copy(source, destination)
+    if size is None:
+        shutil.copyfile(source, destination)
+        size = os.stat(destination).st_size
+    if preserve_metadata:
+        shutil.copystat(source, destination)
+    return size
+
+
+def _copy_workers(source: Path, destination: Path) -> int:
+    """
+    How many copies to run at once: several when source and destination are
+    different devices, so both queues stay busy, and only a couple when they
+    share one device, to avoid seek thrash on spinning disks.
+    """
+    try:
+        same_device = os.stat(source).st_dev == os.stat(destination).st_dev
+    except OSError:
+        same_device = True
+    if same_device:
+        return SAME_DEVICE_COPY_WORKERS
+    return min(CROSS_DEVICE_COPY_WORKERS, os.cpu_count() or 1)
+
+
+def sync_filesystem(path: Path) -> None:
+    """
+    Flush the filesystem holding path once, after a whole batch of copies.
+    A crash before this call may lose copies that are not yet recorded
+    anywhere; a retry re-copies them. Uses syncfs on Linux, sync elsewhere.
+    """
+    if sys.platform.startswith("linux"):
+        syncfs = _libc_function("syncfs", ctypes.c_int)
+        if syncfs is not None:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                pass
+            else:
+                try:
+                    if syncfs(fd) == 0:
+                        return
+                finally:
+                    os.close(fd)
+    if hasattr(os, "sync"):
+        os.sync()
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        _advise(handle.fileno(), "POSIX_FADV_SEQUENTIAL")
+        for chunk in iter(lambda: handle.read(VERIFY_BLOCK_SIZE), b""):
+            digest.update(chunk)
+        _advise(handle.fileno(), "POSIX_FADV_DONTNEED")
+    return digest.hexdigest()
+
+
+def _copy_matches(source: Path, target: Path, copied_size: int, verify: str) -> bool:
+    if verify == "size":
+        return copied_size == source.stat().st_size
+    if verify == "sha256":
+        if copied_size != source.stat().st_size:
+            return False
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            source_digest, target_digest = executor.map(_sha256, (source, target))
+        return source_digest == target_digest
+    return True
+
+
+def copy_and_verify(source: Path, dest: Path, verify: str = "none") -> bool:
+    """
+    Copies a file into dest, reporting any failure instead of raising.
+    verify is one of VERIFY_MODES: "size" checks the copy's size against the
+    source, "sha256" also compares both files' digests. A copy that fails
+    verification is removed so a rerun copies it again.
+    """
+    if verify not in VERIFY_MODES:
+        raise ValueError(f"Unknown verify mode: {verify}")
+    target = dest / source.name
+    try:
+        copied_size = copy_file(source, target)
+        if not _copy_matches(source, target, copied_size, verify):
             typer.echo(f"  [ERROR] Verification failed for {source.name} at {dest}", err=True)
+            target.unlink(missing_ok=True)
             return False
     except Exception as e:
         typer.echo(f"  [ERROR] Could not copy {source.name} to {dest}: {e}", err=True)
@@ -18,20 +281,89 @@ def copy_and_verify(source: Path, dest: Path) -> bool:
     return True
 
 
-def _is_duplicate(file_path: Path, dest_dir: Path) -> bool:
+def _scan_dir(path: str) -> Tuple[List[os.DirEntry], List[str]]:
+    files: List[os.DirEntry] = []
+    subdirs: List[str] = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file():
+                        entry.stat()
+                        files.append(entry)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return files, subdirs
+
+
+def iter_files(root: Path, workers: int = SCAN_WORKERS) -> Iterator[os.DirEntry]:
     """
-    Check if a file is a duplicate at the destination (by name and size).
+    Yield a DirEntry for every file under root, with stat already cached.
+    Directories are listed concurrently one level at a time, which hides
+    per-directory latency on spinning disks and network shares; entries are
+    handed out as each level completes rather than collected up front.
     """
-    dest_file = dest_dir / file_path.name
-    if not dest_file.exists():
-        return False
+    pending = [str(root)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while pending:
+            level = list(executor.map(_scan_dir, pending))
+            pending = []
+            for found_files, subdirs in level:
+                yield from found_files
+                pending.extend(subdirs)
 
-    try:
-        source_size = file_path.stat().st_size
-        dest_size = dest_file.stat().st_size
-        return source_size == dest_size
-    except Exception:
-        return False
+
+def scan_files(root: Path, workers: int = SCAN_WORKERS) -> List[os.DirEntry]:
+    """Return iter_files(root) as a list."""
+    return list(iter_files(root, workers))
+
+
+def scan_media(
+    root: Path, extensions: frozenset, workers: int = SCAN_WORKERS
+) -> List[Tuple[Path, os.stat_result]]:
+    """
+    List (path, stat) for files under root with one of the given lowercase
+    extensions, reusing the stat each entry was scanned with.
+    """
+    return [
+        (Path(entry.path), entry.stat())
+        for entry in iter_files(root, workers)
+        if os.path.splitext(entry.name)[1].lower() in extensions
+    ]
+
+
+def _index_dir(directory: Path, extensions: frozenset = frozenset()) -> Dict[str, int]:
+    """
+    Map file name -> size for files directly inside directory, optionally
+    limited to the given lowercase extensions, from a single scandir pass.
+    """
+    index: Dict[str, int] = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if extensions and os.path.splitext(entry.name)[1].lower() not in extensions:
+                continue
+            try:
+                if entry.is_file():
+                    index[entry.name] = entry.stat().st_size
+            except OSError:
+                continue
+    return index
+
+
+def _same_size_and_mtime(first: os.stat_result, second: os.stat_result) -> bool:
+    """
+    Whether two stats describe the same copy: equal size and modification
+    times within MTIME_TOLERANCE_NS (copy_file preserves mtimes, but FAT and
+    exFAT cards only store them to two seconds).
+    """
+    return (
+        first.st_size == second.st_size
+        and abs(first.st_mtime_ns - second.st_mtime_ns) <= MTIME_TOLERANCE_NS
+    )
 
 
 def _build_destination_index(root: Path) -> Set[Tuple[str, int]]:
@@ -39,17 +371,9 @@ def _build_destination_index(root: Path) -> Set[Tuple[str, int]]:
     Build a set of (filename, size) for all video files under root.
     Used to skip files already ingested anywhere in laptop or archive (cross-shoot).
     """
-    video_extensions = {".mp4", ".mov", ".mxf", ".mts", ".avi", ".m4v", ".braw", ".r3d", ".crm"}
-    index: Set[Tuple[str, int]] = set()
     if not root.exists():
-        return index
-    for f in root.rglob("*"):
-        if f.is_file() and f.suffix.lower() in video_extensions:
-            try:
-                index.add((f.name, f.stat().st_size))
-            except (OSError, FileNotFoundError):
-                pass
-    return index
+        return set()
+    return {(path.name, stat.st_size) for path, stat in scan_media(root, VIDEO_EXTENSIONS)}
 
 
 def _format_bytes(num: int) -> str:
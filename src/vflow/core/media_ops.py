@@ -1,27 +1,145 @@
 from __future__ import annotations
 
-import shutil
+import ctypes
+import json
+import os
+import plistlib
 import subprocess
+import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 import typer
 
+from .fs_ops import copy_file
 
-def tag_media_file(source_file: Path, tags_str: str) -> Path:
+try:
+    from mutagen import MutagenError
+    from mutagen.mp4 import MP4
+except ImportError:
+    MP4 = None
+    MutagenError = Exception
+
+
+FINDER_TAGS_XATTR = "com.apple.metadata:_kMDItemUserTags"
+FFMPEG_STDERR_TAIL = 64 * 1024
+MP4_SUFFIXES = frozenset({".mp4", ".mov", ".m4v"})
+
+
+def run_ffmpeg(args: list[str]) -> None:
     """
-    Embed metadata tags into a media file via ffmpeg and apply macOS Finder tags.
-    Returns the path to the new tagged copy (caller is responsible for cleanup).
+    Run ffmpeg with the given arguments, logging errors only. stderr is kept
+    as bytes and only its tail is decoded, onto the CalledProcessError.
     """
-    tags_list = [tag.strip() for tag in tags_str.split(",")]
+    command = ["ffmpeg", "-hide_banner", "-loglevel", "error", "-nostdin", *args]
+    result = subprocess.run(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    if result.returncode:
+        raise subprocess.CalledProcessError(
+            result.returncode,
+            command,
+            stderr=result.stderr[-FFMPEG_STDERR_TAIL:].decode("utf-8", "replace"),
+        )
 
-    tagged_file_path = source_file.with_name(
-        f"{source_file.stem}_tagged{source_file.suffix}"
+
+@lru_cache(maxsize=None)
+def _setxattr_function():
+    libc = ctypes.CDLL(None, use_errno=True)
+    function = libc.setxattr
+    function.argtypes = [
+        ctypes.c_char_p,
+        ctypes.c_char_p,
+        ctypes.c_void_p,
+        ctypes.c_size_t,
+        ctypes.c_uint32,
+        ctypes.c_int,
+    ]
+    function.restype = ctypes.c_int
+    return function
+
+
+def _set_finder_tags(path: Path, tags: list[str]) -> None:
+    """Write Finder tags as the binary plist macOS stores in an xattr."""
+    data = plistlib.dumps(tags, fmt=plistlib.FMT_BINARY)
+    if _setxattr_function()(
+        os.fsencode(path), FINDER_TAGS_XATTR.encode(), data, len(data), 0, 0
+    ):
+        errno = ctypes.get_errno()
+        raise OSError(errno, os.strerror(errno), str(path))
+
+
+def _tag_mp4_in_place(path: Path, tags_str: str) -> bool:
+    """
+    Patch comment/keyword atoms of an MP4/MOV file with mutagen, when it is
+    installed. Only the moov box is rewritten, not the media data.
+    """
+    if MP4 is None or path.suffix.lower() not in MP4_SUFFIXES:
+        return False
+    try:
+        media = MP4(str(path))
+        media["\xa9cmt"] = [tags_str]
+        media["keyw"] = [tags_str]
+        media.save()
+    except (MutagenError, OSError):
+        return False
+    return True
+
+
+def _has_tags(path: Path, tags_str: str) -> bool:
+    """
+    Whether path already carries tags_str as its comment and keywords. MP4/MOV
+    tags are read with mutagen when installed, anything else with ffprobe;
+    a file that cannot be read counts as untagged.
+    """
+    if MP4 is not None and path.suffix.lower() in MP4_SUFFIXES:
+        try:
+            tags = MP4(str(path)).tags or {}
+        except (MutagenError, OSError):
+            return False
+        return tags.get("\xa9cmt") == [tags_str] and tags.get("keyw") == [tags_str]
+    try:
+        result = subprocess.run(
+            [
+                "ffprobe",
+                "-v",
+                "quiet",
+                "-show_entries",
+                "format_tags=comment,keywords",
+                "-of",
+                "json",
+                str(path),
+            ],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            check=True,
+        )
+        format_tags = json.loads(result.stdout).get("format", {}).get("tags", {})
+    except (subprocess.CalledProcessError, FileNotFoundError, ValueError):
+        return False
+    return (
+        format_tags.get("comment") == tags_str
+        and format_tags.get("keywords") == tags_str
     )
 
+
+def _embed_tags(
+    source_file: Path, output: Path, tags_str: str, overwrite: bool
+) -> None:
+    if MP4 is not None and source_file.suffix.lower() in MP4_SUFFIXES:
+        copy_file(source_file, output, preserve_metadata=False)
+        if _tag_mp4_in_place(output, tags_str):
+            typer.echo("Embedded universal metadata with mutagen.")
+            return
+        output.unlink(missing_ok=True)
+
     typer.echo("Embedding universal metadata with ffmpeg...")
     try:
         ffmpeg_cmd = [
-            "ffmpeg",
             "-i",
             str(source_file),
             "-metadata",
@@ -30,31 +148,72 @@ def tag_media_file(source_file: Path, tags_str: str) -> Path:
             f"keywords={tags_str}",
             "-codec",
             "copy",
-            str(tagged_file_path),
         ]
-        subprocess.run(ffmpeg_cmd, check=True, capture_output=True, text=True)
+        if overwrite:
+            ffmpeg_cmd.append("-y")
+        ffmpeg_cmd.append(str(output))
+        run_ffmpeg(ffmpeg_cmd)
     except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        if overwrite:
+            output.unlink(missing_ok=True)
         typer.echo(f"Error with ffmpeg: {e}", err=True)
         typer.echo(
             "Please ensure ffmpeg is installed and in your PATH.", err=True
         )
         raise typer.Exit(code=1)
 
-    typer.echo("Applying macOS Finder tags...")
-    try:
-        tag_plist = "".join(f"<string>{tag}</string>" for tag in tags_list)
-        bplist_cmd = (
-            "xattr -w com.apple.metadata:_kMDItemUserTags "
-            '\'<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" '
-            '"http://www.apple.com/DTDs/PropertyList-1.0.dtd"><plist version="1.0">'
-            f"<array>{tag_plist}</array></plist>' "
-            f'"{str(tagged_file_path)}"'
+
+def tag_media_file(
+    source_file: Path, tags_str: str, destination: Optional[Path] = None
+) -> Path:
+    """
+    Embed metadata tags into a media file and apply macOS Finder tags.
+    Files that already carry the tags are left as they are; MP4/MOV files are
+    patched with mutagen when available; anything else is stream-copied
+    through ffmpeg. With a destination, the tagged file is
+    written straight to it (via a temporary name in the same folder), or
+    patched in place when destination is the source, and that path is
+    returned. Otherwise returns a new tagged copy next to the source (caller
+    is responsible for cleanup).
+    """
+    tags_list = [tag.strip() for tag in tags_str.split(",")]
+
+    if destination is not None:
+        tagged_file_path = destination
+        ffmpeg_output = destination.with_name(
+            f".{destination.stem}.vflow-part{destination.suffix}"
         )
-        subprocess.run(
-            bplist_cmd, shell=True, check=True, capture_output=True
+    else:
+        tagged_file_path = source_file.with_name(
+            f"{source_file.stem}_tagged{source_file.suffix}"
         )
-    except (subprocess.CalledProcessError, FileNotFoundError) as e:
-        typer.echo(f"Could not apply macOS tags: {e}", err=True)
+        ffmpeg_output = tagged_file_path
+
+    if _has_tags(source_file, tags_str):
+        # Already tagged: skip the container rewrite, copying if need be.
+        typer.echo("Universal metadata already present.")
+        if tagged_file_path != source_file:
+            copy_file(source_file, ffmpeg_output, preserve_metadata=False)
+            if ffmpeg_output != tagged_file_path:
+                os.replace(ffmpeg_output, tagged_file_path)
+    elif tagged_file_path == source_file and _tag_mp4_in_place(source_file, tags_str):
+        typer.echo("Embedded universal metadata in place.")
+    else:
+        _embed_tags(
+            source_file,
+            ffmpeg_output,
+            tags_str,
+            overwrite=ffmpeg_output != tagged_file_path,
+        )
+        if ffmpeg_output != tagged_file_path:
+            os.replace(ffmpeg_output, tagged_file_path)
+
+    if sys.platform == "darwin":
+        typer.echo("Applying macOS Finder tags...")
+        try:
+            _set_finder_tags(tagged_file_path, tags_list)
+        except OSError as e:
+            typer.echo(f"Could not apply macOS tags: {e}", err=True)
 
     return tagged_file_path
 
@@ -74,7 +233,6 @@ def copy_metadata_between_files(source_file: Path, target_file: Path) -> bool:
 
     try:
         ffmpeg_cmd = [
-            "ffmpeg",
             "-i",
             str(target_file),
             "-i",
@@ -92,9 +250,9 @@ def copy_metadata_between_files(source_file: Path, target_file: Path) -> bool:
             "-y",
             str(temp_output),
         ]
-        subprocess.run(ffmpeg_cmd, check=True, capture_output=True, text=True)
+        run_ffmpeg(ffmpeg_cmd)
 
-        shutil.move(str(temp_output), str(target_file))
+        os.replace(temp_output, target_file)
         return True
 
     except FileNotFoundError:
@@ -108,3 +266,62 @@ def copy_metadata_between_files(source_file: Path, target_file: Path) -> bool:
         if temp_output.exists():
             temp_output.unlink()
         return False
+
+
+def copy_metadata_batch(pairs: list[tuple[Path, Path]]) -> list[bool]:
+    """
+    Copy metadata for several (source_file, target_file) pairs with a single
+    ffmpeg process writing one output per pair. If the batch fails, each pair
+    is retried on its own so one bad file does not sink the others.
+    """
+    if len(pairs) < 2 or not all(
+        source_file.exists() and target_file.exists()
+        for source_file, target_file in pairs
+    ):
+        return [copy_metadata_between_files(s, t) for s, t in pairs]
+
+    temp_outputs = [
+        target_file.with_name(f"{target_file.stem}_temp_meta{target_file.suffix}")
+        for _, target_file in pairs
+    ]
+    ffmpeg_cmd: list[str] = []
+    for source_file, target_file in pairs:
+        ffmpeg_cmd += ["-i", str(target_file), "-i", str(source_file)]
+    for index, temp_output in enumerate(temp_outputs):
+        ffmpeg_cmd += [
+            "-map",
+            f"{2 * index}:v",
+            "-map",
+            f"{2 * index}:a",
+            "-map_metadata",
+            str(2 * index + 1),
+            "-c:v",
+            "copy",
+            "-c:a",
+            "copy",
+            "-y",
+            str(temp_output),
+        ]
+
+    try:
+        run_ffmpeg(ffmpeg_cmd)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        for temp_output in temp_outputs:
+            if temp_output.exists():
+                temp_output.unlink()
+        return [copy_metadata_between_files(s, t) for s, t in pairs]
+
+    results = []
+    for temp_output, (_, target_file) in zip(temp_outputs, pairs):
+        try:
+            os.replace(temp_output, target_file)
+        except OSError as e:
+            typer.echo(f"\nWarning: Could not replace {target_file}: {e}", err=True)
+            try:
+                temp_output.unlink(missing_ok=True)
+            except OSError:
+                pass
+            results.append(False)
+        else:
+            results.append(True)
+    return results
@@ -1,34 +1,45 @@
 import re
-from typing import Optional
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Callable, List, Optional, Sequence, TypeVar
 from pathlib import Path
 
 
+_RE_NUM = re.compile(r"(\d+)")
+_RE_RANGE_BOTH = re.compile(r"^([A-Za-z]*?)(\d+)-([A-Za-z]*?)(\d+)$", re.IGNORECASE)
+_RE_RANGE_ONE = re.compile(r"^([A-Za-z]*?)(\d+)-(\d+)$", re.IGNORECASE)
+_RE_STRIP_DIGITS = re.compile(r"\d+")
+
+_T = TypeVar("_T")
+
+
 def _extract_number_from_filename(filename: str) -> Optional[int]:
     """
     Extract the first numeric sequence from a filename.
     Returns the number as an integer, or None if no number found.
     Handles zero-padding by extracting the numeric value.
     """
-    match = re.search(r"(\d+)", filename)
+    match = _RE_NUM.search(filename)
     if match:
         return int(match.group(1))
     return None
 
 
+@lru_cache(maxsize=512)
 def _parse_range_pattern(pattern: str) -> tuple[Optional[str], Optional[int], Optional[int]]:
     """
     Parse a range pattern like "C3317-C3351" or "3317-3351" or "C3317-3351".
     Returns (prefix, start_num, end_num) or (None, None, None) if not a range.
     """
     # Pattern to match ranges like "C3317-C3351" or "3317-3351" or "C3317-3351"
-    # The pattern can have a prefix before the first number, and optionally before the second
-    pattern_upper = pattern.upper()
+    # The pattern can have a prefix before the first number, and optionally before the second.
+    # Matching is case-insensitive; only the captured prefixes are uppercased.
 
     # Try pattern with prefix on both sides: "C3317-C3351"
-    range_match = re.match(r"^([A-Za-z]*?)(\d+)-([A-Za-z]*?)(\d+)$", pattern_upper)
+    range_match = _RE_RANGE_BOTH.match(pattern)
     if range_match:
-        prefix1 = range_match.group(1) if range_match.group(1) else None
-        prefix2 = range_match.group(3) if range_match.group(3) else None
+        prefix1 = range_match.group(1).upper() or None
+        prefix2 = range_match.group(3).upper() or None
 
         # Use the prefix from the first number, but require both to match (or both be None)
         if (prefix1 is None and prefix2 is None) or (prefix1 and prefix2 and prefix1 == prefix2):
@@ -41,9 +52,9 @@ def _parse_range_pattern(pattern: str) -> tuple[Optional[str], Optional[int], Op
 
     # Try pattern with no prefix: "3317-3351" or with prefix only on first: "C3317-3351"
     # This regex allows digits after the dash, and will capture prefix from first number only
-    range_match = re.match(r"^([A-Za-z]*?)(\d+)-(\d+)$", pattern_upper)
+    range_match = _RE_RANGE_ONE.match(pattern)
     if range_match:
-        prefix = range_match.group(1) if range_match.group(1) else None
+        prefix = range_match.group(1).upper() or None
         start_num = int(range_match.group(2))
         end_num = int(range_match.group(3))
 
@@ -53,13 +64,26 @@ def _parse_range_pattern(pattern: str) -> tuple[Optional[str], Optional[int], Op
     return (None, None, None)  # Not a range
 
 
+@lru_cache(maxsize=512)
+def _pattern_terms(pattern: str) -> tuple[str, Optional[int], str]:
+    """
+    Per-pattern parts of a non-range match, computed once per pattern:
+    (lowercased pattern, its first number, its letters with digits removed).
+    """
+    pattern_lower = pattern.lower()
+    return (
+        pattern_lower,
+        _extract_number_from_filename(pattern),
+        _RE_STRIP_DIGITS.sub("", pattern_lower),
+    )
+
+
 def _matches_pattern(pattern: str, filename: str) -> bool:
     """
     Check if a filename matches a pattern, handling both regular patterns and ranges.
     Uses numeric comparison to handle zero-padding.
     """
     filename_lower = filename.lower()
-    pattern_lower = pattern.lower()
 
     # First, check if pattern is a range
     prefix, start_num, end_num = _parse_range_pattern(pattern)
@@ -78,14 +102,13 @@ def _matches_pattern(pattern: str, filename: str) -> bool:
         return start_num <= file_num <= end_num
 
     # Not a range - try numeric matching first (for better zero-padding handling)
-    pattern_num = _extract_number_from_filename(pattern)
+    pattern_lower, pattern_num, pattern_letters = _pattern_terms(pattern)
     file_num = _extract_number_from_filename(filename)
 
     if pattern_num is not None and file_num is not None:
         # Both have numbers - compare numerically and check prefix
         if pattern_num == file_num:
             # Numbers match - check if prefixes match (if pattern has a prefix)
-            pattern_letters = re.sub(r"\d+", "", pattern_lower)
             if pattern_letters:
                 # Pattern has letters - check if filename contains them
                 return pattern_letters in filename_lower
@@ -96,3 +119,47 @@ def _matches_pattern(pattern: str, filename: str) -> bool:
     # Fallback to substring matching for non-numeric patterns
     return pattern_lower in filename_lower
 
+
+
+def _filter_by_patterns(
+    items: Sequence[_T], patterns: Sequence[str], key: Callable[[_T], str] = str
+) -> List[_T]:
+    """
+    Return the items whose key(item) matches any pattern, in their original
+    order; the same selection as testing _matches_pattern for each pair.
+    Range patterns are answered from a number-sorted index with bisect, so
+    only files inside each range are looked at.
+    """
+    names = [key(item) for item in items]
+    selected = [False] * len(items)
+
+    numbered = sorted(
+        (number, position)
+        for position, number in enumerate(
+            _extract_number_from_filename(name) for name in names
+        )
+        if number is not None
+    )
+    numbers = [number for number, _ in numbered]
+
+    other_patterns: List[str] = []
+    for pattern in patterns:
+        prefix, start_num, end_num = _parse_range_pattern(pattern)
+        if start_num is None or end_num is None:
+            other_patterns.append(pattern)
+            continue
+        prefix_lower = prefix.lower() if prefix else None
+        low = bisect_left(numbers, start_num)
+        high = bisect_right(numbers, end_num)
+        for _, position in numbered[low:high]:
+            if prefix_lower is None or prefix_lower in names[position].lower():
+                selected[position] = True
+
+    if other_patterns:
+        for position, name in enumerate(names):
+            if not selected[position] and any(
+                _matches_pattern(pattern, name) for pattern in other_patterns
+            ):
+                selected[position] = True
+
+    return [item for item, keep in zip(items, selected) if keep]
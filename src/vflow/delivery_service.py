@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import os
 import shutil
-import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import typer
 
-from .core.fs_ops import copy_and_verify
-from .core.media_ops import tag_media_file, copy_metadata_between_files
+from .core.fs_ops import VIDEO_EXTENSIONS
+from .core.media_ops import tag_media_file, copy_metadata_batch
+
+
+METADATA_BATCH_SIZE = 8
+# Stream copies are disk-bound; more concurrent ffmpegs only add seeks.
+METADATA_WORKERS = 4
 
 
 def archive_file(
@@ -37,15 +43,10 @@ def archive_file(
         )
         raise typer.Exit(code=1)
 
-    tagged_file_path = tag_media_file(export_file_path, tags_str)
-
-    typer.echo(f"Copying tagged file to archive: {archive_graded_dir}")
-    if not copy_and_verify(tagged_file_path, archive_graded_dir):
-        typer.echo("Aborting cleanup due to copy failure.", err=True)
-        tagged_file_path.unlink()
-        raise typer.Exit(code=1)
-
-    tagged_file_path.unlink()
+    typer.echo(f"Writing tagged file to archive: {archive_graded_dir}")
+    tag_media_file(
+        export_file_path, tags_str, archive_graded_dir / export_file_path.name
+    )
 
     if not keep_log:
         try:
@@ -54,24 +55,17 @@ def archive_file(
                 typer.echo(
                     f"Cleaning up source files from {source_folder}..."
                 )
-                video_extensions = {
-                    ".mp4",
-                    ".mov",
-                    ".mxf",
-                    ".mts",
-                    ".avi",
-                    ".m4v",
-                    ".braw",
-                    ".r3d",
-                    ".crm",
-                }
-                for video_file in source_folder.iterdir():
-                    if (
-                        video_file.is_file()
-                        and video_file.suffix.lower() in video_extensions
-                    ):
-                        video_file.unlink()
-                        typer.echo(f"Deleted: {video_file.name}")
+                with os.scandir(source_folder) as entries:
+                    doomed = [
+                        entry
+                        for entry in entries
+                        if entry.is_file(follow_symlinks=False)
+                        and os.path.splitext(entry.name)[1].lower()
+                        in VIDEO_EXTENSIONS
+                    ]
+                for entry in doomed:
+                    os.unlink(entry.path)
+                    typer.echo(f"Deleted: {entry.name}")
         except Exception as e:
             typer.echo(
                 f"Warning: Could not clean up source files: {e}", err=True
@@ -93,90 +87,62 @@ def copy_metadata_folder(source_folder: Path, target_folder: Path) -> None:
         typer.echo(f"Source folder not found: {source_folder}", err=True)
         raise typer.Exit(code=1)
 
-    video_extensions = {
-        ".mp4",
-        ".mov",
-        ".mxf",
-        ".mts",
-        ".avi",
-        ".m4v",
-        ".braw",
-        ".r3d",
-        ".crm",
-    }
-    target_files = [
-        f
-        for f in target_folder.iterdir()
-        if f.is_file() and f.suffix.lower() in video_extensions
-    ]
+    with os.scandir(target_folder) as entries:
+        target_files = [
+            Path(entry.path)
+            for entry in entries
+            if os.path.splitext(entry.name)[1].lower() in VIDEO_EXTENSIONS
+            and entry.is_file()
+        ]
 
     if not target_files:
         typer.echo("No files found in the target directory.")
         return
 
+    if shutil.which("ffmpeg") is None:
+        typer.echo(
+            "Error: ffmpeg not found. Please install it and ensure it's in your PATH.",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+
     success_count = 0
     fail_count = 0
-
-    with typer.progressbar(target_files, label="Processing files") as progress:
-        for target_file in progress:
-            source_files = list(source_folder.glob(f"{target_file.stem}.*"))
-
-            if not source_files:
-                typer.echo(
-                    f"\nWarning: No matching source file found for '{target_file.name}'. Skipping.",
-                    err=True,
+    source_by_stem: dict[str, Path] = {}
+    with os.scandir(source_folder) as entries:
+        for entry in sorted(entries, key=lambda entry: entry.name):
+            if entry.is_file() and "." in entry.name:
+                source_by_stem.setdefault(
+                    os.path.splitext(entry.name)[0], Path(entry.path)
                 )
-                fail_count += 1
-                continue
 
-            source_file = source_files[0]
-            temp_output = target_file.with_name(
-                f"{target_file.stem}_temp_meta{target_file.suffix}"
+    pairs: list[tuple[Path, Path]] = []
+    for target_file in target_files:
+        source_file = source_by_stem.get(target_file.stem)
+        if source_file is None:
+            typer.echo(
+                f"\nWarning: No matching source file found for '{target_file.name}'. Skipping.",
+                err=True,
             )
-
-            try:
-                ffmpeg_cmd = [
-                    "ffmpeg",
-                    "-i",
-                    str(target_file),
-                    "-i",
-                    str(source_file),
-                    "-map",
-                    "0:v",
-                    "-map",
-                    "0:a",
-                    "-map_metadata",
-                    "1",
-                    "-c:v",
-                    "copy",
-                    "-c:a",
-                    "copy",
-                    str(temp_output),
-                ]
-                subprocess.run(
-                    ffmpeg_cmd + ["-y"],
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                )
-
-                shutil.move(str(temp_output), str(target_file))
-                success_count += 1
-
-            except FileNotFoundError:
-                typer.echo(
-                    "\nError: ffmpeg not found. Please install it and ensure it's in your PATH.",
-                    err=True,
-                )
-                raise typer.Exit(code=1)
-            except subprocess.CalledProcessError as e:
-                typer.echo(
-                    f"\nError processing '{target_file.name}': {e.stderr}",
-                    err=True,
-                )
-                fail_count += 1
-                if temp_output.exists():
-                    temp_output.unlink()
+            fail_count += 1
+            continue
+        pairs.append((source_file, target_file))
+
+    # Each ffmpeg stream copy is an independent subprocess, so threads are
+    # enough to keep several running at once; batching amortizes startup.
+    batches = [
+        pairs[start : start + METADATA_BATCH_SIZE]
+        for start in range(0, len(pairs), METADATA_BATCH_SIZE)
+    ]
+    workers = min(METADATA_WORKERS, os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(copy_metadata_batch, batch) for batch in batches]
+        with typer.progressbar(length=len(pairs), label="Processing files") as progress:
+            for future in as_completed(futures):
+                results = future.result()
+                success_count += sum(results)
+                fail_count += len(results) - sum(results)
+                progress.update(len(results))
 
     typer.echo(
         f"\nMetadata copy complete. {success_count} files updated, {fail_count} files skipped."
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import hashlib
 import os
-import shutil
 from pathlib import Path
 from typing import Optional
 
+from .core.fs_ops import copy_file
+
 
 CHECKSUM_ALGORITHM = "sha256"
 EXPORT_CATEGORIES = {
@@ -94,7 +95,7 @@ def _copy_verified(plan: dict) -> None:
     destination.parent.mkdir(parents=True, exist_ok=True)
     temporary = destination.with_name(f".{destination.name}.vflow-part")
     try:
-        shutil.copy2(source, temporary)
+        copy_file(source, temporary)
         if _checksum(temporary) != plan["checksum"]:
             raise ValueError(f"Archive checksum verification failed for {source}")
         os.replace(temporary, destination)
@@ -5,18 +5,22 @@ import json
 import os
 import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from .core.fs_ops import COPY_BUFSIZE, copy_file, scan_files, sync_filesystem
+
 
 CHECKSUM_ALGORITHM = "sha256"
 MANIFEST_NAME = "manifest.json"
 PENDING_MANIFEST_NAME = ".manifest.pending.json"
 CONTENTS_DIRECTORY = "contents"
 MANIFEST_VERSION = 1
+SOURCE_CHECKSUM_WORKERS = 4
 
 
 def _checksum(path: Path) -> str:
@@ -43,25 +47,27 @@ def _safe_identity(value: str, label: str) -> str:
     return value
 
 
+def _source_entry(source: Path, path: Path) -> dict:
+    return {
+        "relative_path": path.relative_to(source).as_posix(),
+        "byte_size": path.stat().st_size,
+        "checksum": _checksum(path),
+    }
+
+
 def _source_entries(
     source: Path, selected_files: Optional[list[Path]] = None
 ) -> list[dict]:
     files = (
         selected_files
         if selected_files is not None
-        else [path for path in source.rglob("*") if path.is_file()]
+        else [Path(entry.path) for entry in scan_files(source)]
     )
-    entries = []
-    for path in sorted(files, key=lambda item: item.relative_to(source).as_posix()):
-        relative_path = path.relative_to(source).as_posix()
-        entries.append(
-            {
-                "relative_path": relative_path,
-                "byte_size": path.stat().st_size,
-                "checksum": _checksum(path),
-            }
-        )
-    return entries
+    ordered = sorted(files, key=lambda item: item.relative_to(source).as_posix())
+    # Checksumming reads every source file once; overlap those reads so card
+    # latency and hashing no longer serialize. map() keeps manifest order.
+    with ThreadPoolExecutor(max_workers=SOURCE_CHECKSUM_WORKERS) as executor:
+        return list(executor.map(lambda path: _source_entry(source, path), ordered))
 
 
 def _generated_batch_identity(source: Path, entries: list[dict]) -> str:
@@ -77,7 +83,34 @@ def _generated_batch_identity(source: Path, entries: list[dict]) -> str:
     return f"{source_name}-{identity_digest.hexdigest()[:12]}"
 
 
+def _resume_copy(source: Path, temporary: Path) -> bool:
+    """
+    Append the rest of source to a partial copy an interrupted ingest left
+    behind. The partial file's size is the bytes actually written, since
+    copy_file preallocates without growing it. Returns False when there is
+    nothing to resume.
+    """
+    try:
+        copied = temporary.stat().st_size
+    except FileNotFoundError:
+        return False
+    if not copied or copied > source.stat().st_size:
+        return False
+    with source.open("rb") as src, temporary.open("r+b") as dst:
+        src.seek(copied)
+        dst.seek(copied)
+        shutil.copyfileobj(src, dst, COPY_BUFSIZE)
+    shutil.copystat(source, temporary)
+    return True
+
+
 def _copy_verified(source: Path, destination: Path, expected_checksum: str) -> str:
+    """
+    Copy source to destination through a .vflow-part file and verify it
+    against expected_checksum. Only a checksum mismatch deletes the partial
+    file. It is kept on purpose after an OSError, such as a pulled card or a
+    full drive, so a retry can append the rest with _resume_copy.
+    """
     if destination.exists():
         if destination.is_file() and _checksum(destination) == expected_checksum:
             return "skipped"
@@ -86,11 +119,17 @@ def _copy_verified(source: Path, destination: Path, expected_checksum: str) -> s
     destination.parent.mkdir(parents=True, exist_ok=True)
     temporary = destination.with_name(f".{destination.name}.vflow-part")
     try:
-        shutil.copy2(source, temporary)
-        if _checksum(temporary) != expected_checksum:
-            raise ValueError(f"Checksum verification failed for {source}")
+        # The checksum covers the resumed prefix too; a stale partial copy
+        # fails it and is copied again from the start.
+        if not (
+            _resume_copy(source, temporary)
+            and _checksum(temporary) == expected_checksum
+        ):
+            copy_file(source, temporary)
+            if _checksum(temporary) != expected_checksum:
+                raise ValueError(f"Checksum verification failed for {source}")
         os.replace(temporary, destination)
-    except Exception:
+    except ValueError:
         try:
             temporary.unlink(missing_ok=True)
         except OSError:
@@ -193,6 +232,8 @@ def ingest_import_batch(
         raise typer.Exit(code=1)
 
     if not manifest_path.exists():
+        if copied:
+            sync_filesystem(batch_directory)
         os.replace(pending_manifest_path, manifest_path)
 
     return {
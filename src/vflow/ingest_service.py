@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-import shutil
-from datetime import datetime
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime
 from pathlib import Path
 from typing import Optional
 
@@ -11,18 +12,32 @@ from .core.date_utils import (
     parse_shoot_date_range,
     format_shoot_name,
 )
-from .core.fs_ops import copy_and_verify
-from .core.patterns import _extract_number_from_filename, _matches_pattern
+from .core.fs_ops import (
+    PHOTO_EXTENSIONS,
+    VIDEO_EXTENSIONS,
+    copy_file,
+    scan_files,
+    scan_media,
+    _build_destination_index,
+    _index_dir,
+)
+from .core.patterns import _extract_number_from_filename, _filter_by_patterns
 from .import_batch import ingest_import_batch
 
 
-def _get_media_date(file_path: Path) -> datetime:
+PHOTO_COPY_WORKERS = 4
+
+
+def _get_media_date(
+    file_path: Path, stat_result: Optional[os.stat_result] = None
+) -> datetime:
     """
     Extract the date/time from a media file.
     Uses filesystem creation date (birthtime) if available, else modification time.
+    Pass stat_result when the caller has already stat()ed the file.
     """
     try:
-        stat = file_path.stat()
+        stat = stat_result if stat_result is not None else file_path.stat()
         creation_time = getattr(stat, "st_birthtime", None)
         if creation_time:
             return datetime.fromtimestamp(creation_time)
@@ -102,72 +117,42 @@ def ingest_report(
         typer.echo(f"Source directory not found: {source_path}", err=True)
         raise typer.Exit(code=1)
 
-    video_extensions = {
-        ".mp4",
-        ".mov",
-        ".mxf",
-        ".mts",
-        ".avi",
-        ".m4v",
-        ".braw",
-        ".r3d",
-        ".crm",
-    }
-    all_files: list[Path] = []
-    for file_path in source_path.rglob("*"):
-        if file_path.is_file() and file_path.suffix.lower() in video_extensions:
-            all_files.append(file_path)
+    all_files = scan_media(source_path, VIDEO_EXTENSIONS)
 
     if not all_files:
         typer.echo("No video files found in the source directory.", err=True)
         return
 
-    laptop_index: set[tuple[str, int]] = set()
-    if laptop_path and laptop_path.exists():
-        for f in laptop_path.rglob("*"):
-            if f.is_file() and f.suffix.lower() in video_extensions:
-                try:
-                    laptop_index.add((f.name, f.stat().st_size))
-                except (OSError, FileNotFoundError):
-                    pass
+    laptop_index = _build_destination_index(laptop_path) if laptop_path else set()
 
     archive_raw = archive_path / "Video" / "RAW"
-    archive_index: set[tuple[str, int]] = set()
-    if archive_raw.exists():
-        for f in archive_raw.rglob("*"):
-            if f.is_file() and f.suffix.lower() in video_extensions:
-                try:
-                    archive_index.add((f.name, f.stat().st_size))
-                except (OSError, FileNotFoundError):
-                    pass
+    archive_index = _build_destination_index(archive_raw)
 
-    from collections import defaultdict
+    from collections import Counter, defaultdict
 
     by_date: dict[date, list[tuple[Path, int, bool, bool]]] = defaultdict(list)
-    for f in all_files:
-        try:
-            dt = _get_media_date(f)
-            d = dt.date()
-            size = f.stat().st_size
-            key = (f.name, size)
-            in_laptop = key in laptop_index
-            in_archive = key in archive_index
-            by_date[d].append((f, size, in_laptop, in_archive))
-        except (OSError, FileNotFoundError):
-            continue
+    for f, stat in all_files:
+        d = _get_media_date(f, stat).date()
+        size = stat.st_size
+        key = (f.name, size)
+        in_laptop = key in laptop_index
+        in_archive = key in archive_index
+        by_date[d].append((f, size, in_laptop, in_archive))
 
     dates_sorted = sorted(by_date.keys())
 
-    typer.echo("\n" + "=" * 70)
-    typer.echo("INGEST REPORT (SD CARD = SOURCE OF TRUTH)")
-    typer.echo("=" * 70)
-    typer.echo(f"SD card: {source_path}")
-    typer.echo(f"Laptop:  {laptop_path}")
-    typer.echo(f"Archive: {archive_raw}")
-    typer.echo(
+    # Build the whole report and write it once rather than line by line.
+    lines: list[str] = []
+    lines.append("\n" + "=" * 70)
+    lines.append("INGEST REPORT (SD CARD = SOURCE OF TRUTH)")
+    lines.append("=" * 70)
+    lines.append(f"SD card: {source_path}")
+    lines.append(f"Laptop:  {laptop_path}")
+    lines.append(f"Archive: {archive_raw}")
+    lines.append(
         f"Total on SD: {len(all_files)}  |  Laptop index: {len(laptop_index)}  |  Archive index: {len(archive_index)}"
     )
-    typer.echo("=" * 70)
+    lines.append("=" * 70)
 
     not_on_laptop_by_date: dict[date, list] = {}
     not_on_archive_by_date: dict[date, list] = {}
@@ -183,12 +168,12 @@ def ingest_report(
         if priority_day is not None and d.day == priority_day:
             if priority_month is None or d.month == priority_month:
                 priority_mark = "  << PRIORITY"
-        typer.echo(
+        lines.append(
             f"\n{d}  on SD: {len(items)}  |  laptop: {on_laptop}/{len(items)}  |  archive: {on_archive}/{len(items)}{priority_mark}"
         )
         if missing_laptop:
             names = sorted(x[0].name for x in missing_laptop)
-            typer.echo(
+            lines.append(
                 "   Missing from laptop:  "
                 + (
                     ", ".join(names)
@@ -198,7 +183,7 @@ def ingest_report(
             )
         if missing_archive:
             names = sorted(x[0].name for x in missing_archive)
-            typer.echo(
+            lines.append(
                 "   Missing from archive: "
                 + (
                     ", ".join(names)
@@ -207,30 +192,25 @@ def ingest_report(
                 )
             )
 
-    on_both = sum(
-        1 for d in dates_sorted for (_, _, lb, ab) in by_date[d] if lb and ab
-    )
-    laptop_only_from_sd = sum(
-        1 for d in dates_sorted for (_, _, lb, ab) in by_date[d] if lb and not ab
-    )
-    archive_only_from_sd = sum(
-        1 for d in dates_sorted for (_, _, lb, ab) in by_date[d] if ab and not lb
-    )
-    on_neither = sum(
-        1 for d in dates_sorted for (_, _, lb, ab) in by_date[d] if not lb and not ab
+    presence = Counter(
+        (lb, ab) for items in by_date.values() for (_, _, lb, ab) in items
     )
-
-    typer.echo("\n" + "=" * 70)
-    typer.echo("SUMMARY (files on SD card)")
-    typer.echo("=" * 70)
-    typer.echo(f"  On both laptop + archive: {on_both}")
-    typer.echo(f"  On laptop only:           {laptop_only_from_sd}")
-    typer.echo(f"  On archive only:          {archive_only_from_sd}")
-    typer.echo(f"  On neither (not ingested): {on_neither}")
-    typer.echo("=" * 70)
+    on_both = presence[True, True]
+    laptop_only_from_sd = presence[True, False]
+    archive_only_from_sd = presence[False, True]
+    on_neither = presence[False, False]
+
+    lines.append("\n" + "=" * 70)
+    lines.append("SUMMARY (files on SD card)")
+    lines.append("=" * 70)
+    lines.append(f"  On both laptop + archive: {on_both}")
+    lines.append(f"  On laptop only:           {laptop_only_from_sd}")
+    lines.append(f"  On archive only:          {archive_only_from_sd}")
+    lines.append(f"  On neither (not ingested): {on_neither}")
+    lines.append("=" * 70)
 
     if on_neither > 0:
-        typer.echo("\nSUGGESTED INGEST (missing from both):")
+        lines.append("\nSUGGESTED INGEST (missing from both):")
         for d in dates_sorted:
             not_ing = [x for x in by_date[d] if not x[2] and not x[3]]
             if not not_ing:
@@ -239,10 +219,11 @@ def ingest_report(
             nums = [_extract_number_from_filename(n) for n in names]
             nums = [n for n in nums if n is not None]
             if nums:
-                typer.echo(
+                lines.append(
                     f"  {d}:  --files C{min(nums)}-C{max(nums)}  ({len(not_ing)} files)"
                 )
-    typer.echo("")
+    lines.append("")
+    typer.echo("\n".join(lines))
 
 
 def ingest_shoot(
@@ -259,15 +240,13 @@ def ingest_shoot(
         typer.echo(f"Source directory not found: {source_path}", err=True)
         raise typer.Exit(code=1)
 
-    all_source_files = [path for path in source_path.rglob("*") if path.is_file()]
+    source_stats = {Path(entry.path): entry.stat() for entry in scan_files(source_path)}
+    all_source_files = list(source_stats)
     selected_files: Optional[list[Path]] = None
     if files_filter:
-        selected_files = []
-        for pattern in files_filter:
-            selected_files.extend(
-                path for path in all_source_files if _matches_pattern(pattern, path.name)
-            )
-        selected_files = list(dict.fromkeys(selected_files))
+        selected_files = _filter_by_patterns(
+            all_source_files, files_filter, key=lambda path: path.name
+        )
         if not selected_files:
             typer.echo(
                 f"No files found matching filter: {', '.join(files_filter)}",
@@ -282,7 +261,9 @@ def ingest_shoot(
 
     target_shoot_name = shoot_name
     if auto:
-        dates = [_get_media_date(path) for path in files_for_identity]
+        dates = [
+            _get_media_date(path, source_stats[path]) for path in files_for_identity
+        ]
         target_shoot_name = format_shoot_name(
             min(dates).date(), max(dates).date(), "Ingest"
         )
@@ -315,19 +296,14 @@ def photo_ingest(
     """
     Copies new RAW photo files from source_dir to archive_path/Photo/RAW/<shoot_name>.
     Skips files that already exist in that specific shoot folder by name+size.
-    Preserves timestamps using shutil.copy2.
+    Preserves timestamps like shutil.copy2.
     """
     source_path = Path(source_dir)
     if not source_path.exists() or not source_path.is_dir():
         typer.echo(f"Source directory not found: {source_path}", err=True)
         raise typer.Exit(code=1)
 
-    photo_extensions = {".arw", ".cr2", ".cr3", ".nef", ".dng", ".orf", ".rw2"}
-
-    all_files: list[Path] = []
-    for file_path in source_path.rglob("*"):
-        if file_path.is_file() and file_path.suffix.lower() in photo_extensions:
-            all_files.append(file_path)
+    all_files = scan_media(source_path, PHOTO_EXTENSIONS)
 
     if not all_files:
         typer.echo("No RAW photo files found in source directory.", err=True)
@@ -341,13 +317,7 @@ def photo_ingest(
         raise typer.Exit(code=1)
 
     # Build index of files already in this specific shoot folder only (not archive-wide)
-    shoot_index: set[tuple[str, int]] = set()
-    for f in shoot_dir.iterdir():
-        if f.is_file() and f.suffix.lower() in photo_extensions:
-            try:
-                shoot_index.add((f.name, f.stat().st_size))
-            except (OSError, FileNotFoundError):
-                pass
+    shoot_index = set(_index_dir(shoot_dir, PHOTO_EXTENSIONS).items())
 
     typer.echo(f"\nSource: {source_path}")
     typer.echo(f"Destination: {shoot_dir}")
@@ -358,27 +328,46 @@ def photo_ingest(
     skipped_count = 0
     error_count = 0
 
-    with typer.progressbar(all_files, label=f"Photo ingest {shoot_name}") as progress:
-        for file_path in progress:
-            try:
-                size = file_path.stat().st_size
-            except (OSError, FileNotFoundError):
-                error_count += 1
-                continue
-
-            key = (file_path.name, size)
-            if key in shoot_index:
-                skipped_count += 1
-                continue
-
-            dest_file = shoot_dir / file_path.name
-            try:
-                shutil.copy2(str(file_path), str(dest_file))
-                shoot_index.add(key)
-                copied_count += 1
-            except Exception as e:
-                typer.echo(f"\n[ERROR] Could not copy {file_path.name}: {e}", err=True)
-                error_count += 1
+    # Decide everything up front so the copies themselves can overlap. Two
+    # different files with one name (cameras recycle them) would land on the
+    # same destination, so the later one is reported instead of copied.
+    planned: dict[str, Path] = {}
+    for file_path, stat in all_files:
+        key = (file_path.name, stat.st_size)
+        if key in shoot_index:
+            skipped_count += 1
+            continue
+        if file_path.name in planned:
+            typer.echo(
+                f"\n[ERROR] Name conflict: {file_path} differs from "
+                f"{planned[file_path.name]}, not copied",
+                err=True,
+            )
+            error_count += 1
+            continue
+        shoot_index.add(key)
+        planned[file_path.name] = file_path
+
+    with typer.progressbar(
+        length=len(all_files), label=f"Photo ingest {shoot_name}"
+    ) as progress:
+        progress.update(len(all_files) - len(planned))
+        with ThreadPoolExecutor(max_workers=PHOTO_COPY_WORKERS) as executor:
+            futures = {
+                executor.submit(copy_file, file_path, shoot_dir / name): file_path
+                for name, file_path in planned.items()
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    copied_count += 1
+                except Exception as e:
+                    typer.echo(
+                        f"\n[ERROR] Could not copy {futures[future].name}: {e}",
+                        err=True,
+                    )
+                    error_count += 1
+                progress.update(1)
 
     typer.echo(f"\n{'=' * 70}")
     typer.echo("PHOTO INGEST COMPLETE")
@@ -406,9 +395,6 @@ def card_report(
     video_folder = source_path / "private" / "M4ROOT" / "CLIP"
     photo_folder = source_path / "DCIM" / "100MSDCF"
 
-    video_extensions = {".mp4", ".mov", ".mxf", ".mts", ".avi", ".m4v", ".braw", ".r3d", ".crm"}
-    photo_extensions = {".arw", ".cr2", ".cr3", ".nef", ".dng", ".orf", ".rw2"}
-
     typer.echo("\n" + "=" * 70)
     typer.echo("CARD REPORT")
     typer.echo("=" * 70)
@@ -416,23 +402,13 @@ def card_report(
 
     # Build archive-wide video index for presence check
     archive_video_raw = archive_path / "Video" / "RAW"
-    archive_video_index: set[tuple[str, int]] = set()
-    if archive_video_raw.exists():
-        for f in archive_video_raw.rglob("*"):
-            if f.is_file() and f.suffix.lower() in video_extensions:
-                try:
-                    archive_video_index.add((f.name, f.stat().st_size))
-                except (OSError, FileNotFoundError):
-                    pass
+    archive_video_index = _build_destination_index(archive_video_raw)
 
     from collections import defaultdict
 
     # VIDEO SECTION
     if video_folder.exists() and video_folder.is_dir():
-        video_files: list[Path] = []
-        for f in video_folder.rglob("*"):
-            if f.is_file() and f.suffix.lower() in video_extensions:
-                video_files.append(f)
+        video_files = scan_media(video_folder, VIDEO_EXTENSIONS)
 
         typer.echo(f"\nVIDEOS  ({video_folder})")
         typer.echo("-" * 70)
@@ -441,12 +417,11 @@ def card_report(
             typer.echo("  No video files found.")
         else:
             by_date: dict = defaultdict(list)
-            for f in video_files:
-                try:
-                    d = _get_media_date(f).date()
-                    by_date[d].append(f)
-                except Exception:
-                    continue
+            sizes: dict[Path, int] = {}
+            for f, stat in video_files:
+                d = _get_media_date(f, stat).date()
+                sizes[f] = stat.st_size
+                by_date[d].append(f)
 
             for d in sorted(by_date.keys()):
                 day_files = sorted(by_date[d], key=lambda f: f.name)
@@ -455,7 +430,7 @@ def card_report(
                 last = day_files[-1].name
                 on_archive = sum(
                     1 for f in day_files
-                    if (f.name, f.stat().st_size) in archive_video_index
+                    if (f.name, sizes[f]) in archive_video_index
                 )
                 hdd_label = f"{on_archive}/{count} on HDD" if on_archive > 0 else "NOT on HDD"
                 if first == last:
@@ -467,10 +442,7 @@ def card_report(
 
     # PHOTO SECTION
     if photo_folder.exists() and photo_folder.is_dir():
-        photo_files: list[Path] = []
-        for f in photo_folder.rglob("*"):
-            if f.is_file() and f.suffix.lower() in photo_extensions:
-                photo_files.append(f)
+        photo_files = scan_media(photo_folder, PHOTO_EXTENSIONS)
 
         typer.echo(f"\nPHOTOS  ({photo_folder})")
         typer.echo("-" * 70)
@@ -479,12 +451,8 @@ def card_report(
             typer.echo("  No RAW photo files found.")
         else:
             by_date_p: dict = defaultdict(list)
-            for f in photo_files:
-                try:
-                    d = _get_media_date(f).date()
-                    by_date_p[d].append(f)
-                except Exception:
-                    continue
+            for f, stat in photo_files:
+                by_date_p[_get_media_date(f, stat).date()].append(f)
 
             for d in sorted(by_date_p.keys()):
                 day_files = sorted(by_date_p[d], key=lambda f: f.name)
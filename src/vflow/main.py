@@ -1,19 +1,14 @@
+import sys
 import typer
-import yaml
 from pathlib import Path
 from typing import Optional
 from . import config
-from .checkout_service import checkout_shoot, report_checkout
-from .cleanup_service import delete_working_copy, prepare_cleanup, report_cleanup
-from .export_archive import archive_export, report_archive
-from .finish_service import finish_project, report_finish
 from .resolve_adapter import ResolveUnavailableError, get_resolve_adapter
-from .restore_service import report_restore, restore_archive_asset
 
+# Command bodies import the services they use, so --help and argument
+# errors do not pay for loading every service module.
 app = typer.Typer()
 
-from . import actions
-
 @app.command()
 def ingest(
     source: str = typer.Option(..., "--source", "-s", help="Camera card or source folder to preserve as received."),
@@ -29,6 +24,7 @@ def ingest(
     proves every archived file. Ingest leaves the source untouched and does not
     create a Working Copy.
     """
+    from . import actions
     if not auto and not shoot:
         typer.echo("Either --shoot or --auto must be provided.", err=True)
         raise typer.Exit(code=1)
@@ -70,6 +66,7 @@ def checkout(
     ),
 ):
     """Create a Working Copy, or report paths for Direct Archive Access."""
+    from .checkout_service import checkout_shoot, report_checkout
     app_config = config.load_config()
     archive_path = config.get_location(app_config, "archive")
     try:
@@ -108,6 +105,7 @@ def restore(
     ),
 ):
     """Create a verified copy of an archived asset at a chosen destination."""
+    from .restore_service import report_restore, restore_archive_asset
     app_config = config.load_config()
     archive_path = config.get_location(app_config, "archive")
     try:
@@ -135,6 +133,7 @@ def ingest_report_cmd(
     Compares source to BOTH laptop ingest and archive (duplicate = same name+size in either).
     Highlights a priority day (default 28th) for editing.
     """
+    from . import actions
     app_config = config.load_config()
     archive_dest = config.get_location(app_config, "archive")
     laptop_dest = config.get_location(app_config, "laptop")
@@ -152,6 +151,7 @@ def photo_ingest_cmd(
     avoid Sony filename-recycling false positives. Timestamps are preserved.
     Supported formats: ARW, CR2, CR3, NEF, DNG, ORF, RW2.
     """
+    from . import actions
     app_config = config.load_config()
     archive_dest = config.get_location(app_config, "archive")
     actions.photo_ingest(source, shoot, archive_dest)
@@ -168,6 +168,7 @@ def card_report_cmd(
     For each section, shows date, first/last filename, count, and whether video files
     are already in the archive.
     """
+    from . import actions
     app_config = config.load_config()
     archive_dest = config.get_location(app_config, "archive")
     actions.card_report(source, archive_dest)
@@ -186,6 +187,7 @@ def card_verify_cmd(
     avoiding Sony filename-recycling false positives across shoots.
     Reports PASS or FAIL separately for videos and photos.
     """
+    from . import actions
     app_config = config.load_config()
     archive_dest = config.get_location(app_config, "archive")
     actions.card_verify(source, archive_dest, photo_shoot=photo_shoot)
@@ -200,6 +202,7 @@ def list_duplicates_cmd(
     List duplicate files (same name + size in multiple places) in archive and/or laptop.
     Use --past-hours 24 to only check files ingested in the last 24 hours.
     """
+    from . import actions
     app_config = config.load_config()
     archive_dest = config.get_location(app_config, "archive")
     laptop_dest = config.get_location(app_config, "laptop")
@@ -269,6 +272,7 @@ def archive(
     ),
 ):
     """Copy and verify a retained export without deleting any local files."""
+    from .export_archive import archive_export, report_archive
     app_config = config.load_config()
     exports = config.get_location(app_config, "exports")
     archive_path = config.get_location(app_config, "archive")
@@ -303,6 +307,7 @@ def finish(
     ),
 ):
     """Finish a Project through Resolve without removing local files."""
+    from .finish_service import finish_project, report_finish
     app_config = config.load_config()
     exports = config.get_location(app_config, "exports")
     archive_path = config.get_location(app_config, "archive")
@@ -354,6 +359,7 @@ def cleanup(
     ),
 ):
     """Remove a Working Copy only after every Cleanup safety gate passes."""
+    from .cleanup_service import delete_working_copy, prepare_cleanup, report_cleanup
     app_config = config.load_config()
     archive_path = config.get_location(app_config, "archive")
     try:
@@ -395,6 +401,7 @@ def consolidate(
     destination: str = typer.Option(None, "--destination", "-d", help="Path relative to archive root (e.g., 'Video/Graded'). If provided, uses this instead of --output-folder."),
     files: list[str] = typer.Option(None, "--files", "-f", help="Optional: Specific filenames, patterns, or ranges to process (e.g., 'C3317' or 'project1'). Can specify multiple times. If omitted, processes all files."),
     tags: str = typer.Option(None, "--tags", "-t", help="Optional: Comma-separated metadata tags to add to copied files"),
+    verify: str = typer.Option("none", "--verify", help="Check each copy: 'none', 'size', or 'sha256' (compares source and copy digests)."),
 ):
     """
     Finds and copies unique media from a source drive into the archive.
@@ -406,6 +413,7 @@ def consolidate(
     - Consolidate all files: consolidate --source "/path/to/source" --output-folder "NewFolder"
     - Backup specific projects: consolidate --source "/path/to/exports" --destination "Video/Graded" --files "project1" --files "project2"
     """
+    from . import actions
     if not output_folder and not destination:
         typer.echo("Either --output-folder or --destination must be provided.", err=True)
         raise typer.Exit(code=1)
@@ -423,6 +431,7 @@ def consolidate(
         file_filter=files,
         tags=tags,
         preserve_structure=True,
+        verify=verify,
     )
 
 
@@ -433,6 +442,7 @@ def backup(
     files: list[str] = typer.Option(None, "--files", "-f", help="Optional: Specific filenames, patterns, or ranges to back up (e.g., 'C3317' or 'C3317-C3351'). Can specify multiple times. If omitted, processes all files."),
     tags: str = typer.Option(None, "--tags", "-t", help="Optional: Comma-separated metadata tags to add to copied files."),
     dry_run: bool = typer.Option(False, "--dry-run", help="Analyze what would be backed up without copying any files."),
+    verify: str = typer.Option("none", "--verify", help="Check each copy: 'none', 'size', or 'sha256' (compares source and copy digests)."),
 ):
     """
     Backs up media from an arbitrary source folder into the archive with duplicate checks.
@@ -442,6 +452,7 @@ def backup(
 
     Use --dry-run first to see which files are not already in the archive.
     """
+    from . import actions
     typer.echo(f"{'Dry-running' if dry_run else 'Backing up'} from '{source}' to archive destination '{destination}'...")
 
     app_config = config.load_config()
@@ -456,6 +467,7 @@ def backup(
         tags=tags,
         preserve_structure=True,
         dry_run=dry_run,
+        verify=verify,
     )
 
 
@@ -478,6 +490,7 @@ def verify_backup_cmd(
     This is a general-purpose checker for any two folders (e.g. Desktop/Ingest vs archive).
     Use together with 'backup' or any other copy method to confirm that your backup is complete.
     """
+    from . import actions
     typer.echo(f"Verifying backup between source '{source}' and destination '{destination}'...")
     actions.verify_backup(source, destination, archive_wide=archive_wide)
 
@@ -496,6 +509,7 @@ def list_backups_cmd(
 
     Useful for quickly seeing what has been consolidated, and how large each backup folder is.
     """
+    from . import actions
     app_config = config.load_config()
     archive_hdd_dest = config.get_location(app_config, "archive")
     actions.list_backups(archive_hdd_dest, subpath)
@@ -524,18 +538,20 @@ def restore_folder_cmd(
     This is the inverse of 'backup' for general folders and can be used to pull a
     backup folder from archive back to a workspace path.
     """
+    from . import actions
     actions.restore_folder(source, destination, dry_run=dry_run, overwrite=overwrite)
 
 @app.command()
 def copy_meta(
-    source_folder: Path = typer.Option(..., "--source-folder", "-s", help="Path to the folder with original files"),
-    target_folder: Path = typer.Option(..., "--target-folder", "-t", help="Path to the folder with exported files"),
+    source_folder: str = typer.Option(..., "--source-folder", "-s", help="Path to the folder with original files"),
+    target_folder: str = typer.Option(..., "--target-folder", "-t", help="Path to the folder with exported files"),
 ):
     """
     Copies metadata from files in a source folder to files in a target folder based on matching filenames.
     """
+    from . import actions
     typer.echo(f"Copying metadata from '{source_folder}' to '{target_folder}'...")
-    actions.copy_metadata_folder(source_folder, target_folder)
+    actions.copy_metadata_folder(Path(source_folder), Path(target_folder))
 
 
 
@@ -624,27 +640,86 @@ def make_config():
             typer.echo("Aborting.")
             raise typer.Exit()
 
-    sample_config = {
-        "version": config.CONFIG_VERSION,
-        "locations": {
-            "archive": "/path/to/your/archive",
-            "exports": "/path/to/your/exports",
-            "working": {
-                "laptop": "/path/to/your/laptop/working/copies",
-                "work_ssd": "/path/to/your/fast/working/drive",
-            },
-        },
-        "settings": {
-            "laptop_free_space_reserve_gb": config.DEFAULT_LAPTOP_FREE_SPACE_RESERVE_GB,
-        },
-    }
-    
+    # A fixed template, so this command never needs the YAML emitter.
+    sample_config = (
+        f"version: {config.CONFIG_VERSION}\n"
+        "locations:\n"
+        "  archive: /path/to/your/archive\n"
+        "  exports: /path/to/your/exports\n"
+        "  working:\n"
+        "    laptop: /path/to/your/laptop/working/copies\n"
+        "    work_ssd: /path/to/your/fast/working/drive\n"
+        "settings:\n"
+        f"  laptop_free_space_reserve_gb: {config.DEFAULT_LAPTOP_FREE_SPACE_RESERVE_GB}\n"
+    )
+
     with open(config.CONFIG_PATH, "w") as f:
-        yaml.dump(sample_config, f, default_flow_style=False, sort_keys=False)
-        
+        f.write(sample_config)
+
     typer.echo(f"Sample configuration file created at: {config.CONFIG_PATH}")
     typer.echo("Please edit this file with your actual folder paths.")
 
 
-if __name__ == "__main__":
+@app.command()
+def batch(
+    script: str = typer.Argument(..., help="Text file with one v-flow command per line."),
+):
+    """
+    Runs several v-flow commands from a script in a single process.
+
+    Each line is a command and its options, quoted as in a shell; blank lines
+    and '#' comments are skipped. Startup and configuration loading are paid
+    once for the whole script. Stops at the first command that fails.
+    """
+    import shlex
+
+    # Usage errors come from click: vendored inside newer typer releases,
+    # the click package itself for older ones.
+    try:
+        from typer._click.exceptions import ClickException
+    except ImportError:
+        from click.exceptions import ClickException
+
+    try:
+        lines = Path(script).expanduser().read_text().splitlines()
+    except OSError as error:
+        typer.echo(f"Could not read batch script: {error}", err=True)
+        raise typer.Exit(code=1)
+
+    for number, line in enumerate(lines, 1):
+        try:
+            args = shlex.split(line, comments=True)
+        except ValueError as error:
+            typer.echo(f"Line {number}: {error}", err=True)
+            raise typer.Exit(code=2)
+        if not args:
+            continue
+        if args[0] == "batch":
+            typer.echo(f"Line {number}: a batch script cannot run 'batch'.", err=True)
+            raise typer.Exit(code=2)
+
+        typer.echo(f"\n$ v-flow {shlex.join(args)}")
+        try:
+            code = app(args=args, prog_name="v-flow", standalone_mode=False)
+        except typer.Abort:
+            code = 1
+        except ClickException as error:
+            typer.echo(f"Line {number}: {error}", err=True)
+            code = error.exit_code
+        if code:
+            typer.echo(f"Batch stopped at line {number}.", err=True)
+            raise typer.Exit(code=code)
+
+
+def main() -> None:
+    """Console entry point. Answers --version and runs the Typer app otherwise."""
+    if sys.argv[1:] == ["--version"]:
+        from . import __version__
+
+        typer.echo(f"v-flow {__version__}")
+        return
     app()
+
+
+if __name__ == "__main__":
+    main()
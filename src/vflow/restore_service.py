@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import hashlib
 import os
-import shutil
 from pathlib import Path
 
+from .core.fs_ops import copy_file
+
 
 CHECKSUM_ALGORITHM = "sha256"
 PARTIAL_SUFFIX = ".vflow-part"
@@ -143,7 +144,7 @@ def _copy_verified(entry: dict) -> str:
     destination.parent.mkdir(parents=True, exist_ok=True)
     temporary = destination.with_name(f".{destination.name}{PARTIAL_SUFFIX}")
     try:
-        shutil.copy2(source, temporary)
+        copy_file(source, temporary)
         if _checksum(temporary) != entry["checksum"]:
             raise ValueError(f"Restore checksum verification failed for {source}")
         os.replace(temporary, destination)
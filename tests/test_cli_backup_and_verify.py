@@ -91,3 +91,346 @@ def test_backup_and_verify_archive_wide(tmp_path, monkeypatch):
 
     assert result_verify.exit_code == 0, result_verify.output
     assert "Backup verification PASSED" in result_verify.output
+
+
+def test_backup_skips_by_content_not_name(tmp_path, monkeypatch):
+    archive_root = tmp_path / "archive"
+    _write_file(archive_root / "Video" / "RAW" / "Old" / "RENAMED.MP4", b"same bytes")
+    _write_file(archive_root / "Video" / "RAW" / "Old" / "C0002.MP4", b"other data")
+
+    ingest = tmp_path / "Ingest"
+    _write_file(ingest / "C0001.MP4", b"same bytes")
+    _write_file(ingest / "C0002.MP4", b"fresh take")
+
+    tmp_config = tmp_path / "config.yml"
+    tmp_config.write_text(
+        f"locations:\n"
+        f"  archive: \"{archive_root}\"\n"
+        f"  exports: \"{tmp_path / 'exports'}\"\n"
+        f"  working:\n"
+        f"    laptop: \"{ingest}\"\n"
+    )
+    monkeypatch.setattr(vflow_config, "CONFIG_PATH", tmp_config)
+
+    result = runner.invoke(
+        app,
+        ["backup", "--source", str(ingest), "--destination", "Video/RAW/New"],
+    )
+
+    assert result.exit_code == 0, result.output
+    backup_folder = archive_root / "Video" / "RAW" / "New"
+    assert not (backup_folder / "C0001.MP4").exists()
+    assert (backup_folder / "C0002.MP4").read_bytes() == b"fresh take"
+    assert "1 unique files copied." in result.output
+    assert "1 duplicate files skipped." in result.output
+    assert (archive_root / ".vflow_index.sqlite").exists()
+
+    rerun = runner.invoke(
+        app,
+        ["backup", "--source", str(ingest), "--destination", "Video/RAW/New"],
+    )
+    assert rerun.exit_code == 0, rerun.output
+    assert "0 unique files copied." in rerun.output
+    assert "2 duplicate files skipped." in rerun.output
+
+
+def test_backup_reuses_unchanged_archive_folders(tmp_path, monkeypatch):
+    from vflow import backup_service
+
+    archive_root = tmp_path / "archive"
+    old_shoot = archive_root / "Video" / "RAW" / "Old"
+    _write_file(old_shoot / "A.MP4", b"same bytes")
+    past = 1_600_000_000_000_000_000
+    for folder in (old_shoot, old_shoot.parent, old_shoot.parent.parent):
+        os.utime(folder, ns=(past, past))
+
+    ingest = tmp_path / "Ingest"
+    _write_file(ingest / "X.MP4", b"same bytes")
+
+    tmp_config = tmp_path / "config.yml"
+    tmp_config.write_text(
+        f"locations:\n"
+        f"  archive: \"{archive_root}\"\n"
+        f"  exports: \"{tmp_path / 'exports'}\"\n"
+        f"  working:\n"
+        f"    laptop: \"{ingest}\"\n"
+    )
+    monkeypatch.setattr(vflow_config, "CONFIG_PATH", tmp_config)
+    args = ["backup", "--source", str(ingest), "--destination", "Video/RAW/New"]
+
+    first = runner.invoke(app, args)
+    assert first.exit_code == 0, first.output
+    assert "1 duplicate files skipped." in first.output
+
+    # Same-size in-place edit: the folder's mtime does not change.
+    (old_shoot / "A.MP4").write_bytes(b"diff bytes")
+    listed = []
+    real_scan_dir = backup_service._scan_dir
+    monkeypatch.setattr(
+        backup_service,
+        "_scan_dir",
+        lambda path: listed.append(path) or real_scan_dir(path),
+    )
+
+    second = runner.invoke(app, args)
+    assert second.exit_code == 0, second.output
+    assert str(old_shoot) not in listed
+    assert "1 unique files copied." in second.output
+    assert (archive_root / "Video" / "RAW" / "New" / "X.MP4").exists()
+
+
+def test_backup_copies_file_differing_outside_sampled_windows(tmp_path, monkeypatch):
+    archive_root = tmp_path / "archive"
+    content = bytearray(os.urandom(1024 * 1024))
+    _write_file(archive_root / "Video" / "RAW" / "Old" / "A.MP4", bytes(content))
+    content[300 * 1024] ^= 0xFF
+    ingest = tmp_path / "Ingest"
+    _write_file(ingest / "A.MP4", bytes(content))
+
+    tmp_config = tmp_path / "config.yml"
+    tmp_config.write_text(
+        f"locations:\n"
+        f"  archive: \"{archive_root}\"\n"
+        f"  exports: \"{tmp_path / 'exports'}\"\n"
+        f"  working:\n"
+        f"    laptop: \"{ingest}\"\n"
+    )
+    monkeypatch.setattr(vflow_config, "CONFIG_PATH", tmp_config)
+
+    result = runner.invoke(
+        app,
+        ["backup", "--source", str(ingest), "--destination", "Video/RAW/New"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "1 unique files copied." in result.output
+
+
+def test_backup_sha256_verify_removes_corrupt_copy(tmp_path, monkeypatch):
+    from vflow.core import fs_ops
+
+    archive_root = tmp_path / "archive"
+    archive_root.mkdir()
+    ingest = tmp_path / "Ingest"
+    _write_file(ingest / "A.MP4", b"good bytes")
+    _write_file(ingest / "B.MP4", b"also good")
+
+    tmp_config = tmp_path / "config.yml"
+    tmp_config.write_text(
+        f"locations:\n"
+        f"  archive: \"{archive_root}\"\n"
+        f"  exports: \"{tmp_path / 'exports'}\"\n"
+        f"  working:\n"
+        f"    laptop: \"{ingest}\"\n"
+    )
+    monkeypatch.setattr(vflow_config, "CONFIG_PATH", tmp_config)
+
+    real_copy_file = fs_ops.copy_file
+
+    def corrupting_copy(source, destination, preserve_metadata=True):
+        size = real_copy_file(source, destination, preserve_metadata)
+        if Path(source).name == "A.MP4":
+            Path(destination).write_bytes(b"bad  bytes")
+        return size
+
+    monkeypatch.setattr(fs_ops, "copy_file", corrupting_copy)
+
+    result = runner.invoke(
+        app,
+        [
+            "backup",
+            "--source",
+            str(ingest),
+            "--destination",
+            "Video/RAW/New",
+            "--verify",
+            "sha256",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "1 unique files copied." in result.output
+    assert "Verification failed for A.MP4" in result.output
+    backup_folder = archive_root / "Video" / "RAW" / "New"
+    assert not (backup_folder / "A.MP4").exists()
+    assert (backup_folder / "B.MP4").read_bytes() == b"also good"
+
+    result_invalid = runner.invoke(
+        app,
+        [
+            "backup",
+            "--source",
+            str(ingest),
+            "--destination",
+            "Video/RAW/New",
+            "--verify",
+            "md5",
+        ],
+    )
+    assert result_invalid.exit_code == 1
+
+
+def test_copy_file_recopies_when_kernel_copy_reports_nothing(tmp_path, monkeypatch):
+    from vflow.core import fs_ops
+
+    source = tmp_path / "A.MP4"
+    _write_file(source, b"clip bytes" * 1000)
+    monkeypatch.setattr(os, "copy_file_range", lambda *args: 0, raising=False)
+    monkeypatch.setattr(os, "sendfile", lambda *args: 0, raising=False)
+
+    size = fs_ops.copy_file(source, tmp_path / "copy.MP4")
+
+    assert size == source.stat().st_size
+    assert (tmp_path / "copy.MP4").read_bytes() == source.read_bytes()
+
+
+def test_copy_file_refuses_to_copy_a_file_onto_itself(tmp_path):
+    import shutil
+
+    from vflow.core import fs_ops
+
+    source = tmp_path / "A.MP4"
+    _write_file(source, b"clip bytes")
+
+    try:
+        fs_ops.copy_file(source, tmp_path / "." / "A.MP4")
+    except shutil.SameFileError:
+        pass
+    else:
+        raise AssertionError("copying a file onto itself was not refused")
+    assert source.read_bytes() == b"clip bytes"
+
+
+def test_copy_file_raises_read_errors_instead_of_retrying_another_path(
+    tmp_path, monkeypatch
+):
+    import errno
+    import sys
+
+    import pytest
+
+    from vflow.core import fs_ops
+
+    if not sys.platform.startswith("linux"):
+        pytest.skip("kernel copy paths are Linux-only")
+    source = tmp_path / "A.MP4"
+    _write_file(source, b"clip bytes" * 1000)
+    calls = []
+
+    def failing_copy_file_range(*args):
+        calls.append("copy_file_range")
+        raise OSError(errno.EIO, "Input/output error")
+
+    def unexpected_sendfile(*args):
+        calls.append("sendfile")
+        raise AssertionError("sendfile retried a failed read")
+
+    monkeypatch.setattr(os, "copy_file_range", failing_copy_file_range, raising=False)
+    monkeypatch.setattr(os, "sendfile", unexpected_sendfile, raising=False)
+
+    with pytest.raises(OSError) as raised:
+        fs_ops.copy_file(source, tmp_path / "copy.MP4")
+
+    assert raised.value.errno == errno.EIO
+    assert calls == ["copy_file_range"]
+
+
+def test_copy_file_falls_back_when_kernel_copy_is_unsupported(tmp_path, monkeypatch):
+    import errno
+
+    from vflow.core import fs_ops
+
+    source = tmp_path / "A.MP4"
+    _write_file(source, b"clip bytes" * 1000)
+
+    def unsupported(*args):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+
+    size = fs_ops.copy_file(source, tmp_path / "copy.MP4")
+
+    assert size == source.stat().st_size
+    assert (tmp_path / "copy.MP4").read_bytes() == source.read_bytes()
+
+
+def test_copy_file_raises_sendfile_errors_instead_of_buffering(tmp_path, monkeypatch):
+    import errno
+    import shutil
+    import sys
+
+    import pytest
+
+    from vflow.core import fs_ops
+
+    if not sys.platform.startswith("linux"):
+        pytest.skip("kernel copy paths are Linux-only")
+    source = tmp_path / "A.MP4"
+    _write_file(source, b"clip bytes" * 1000)
+
+    def unsupported(*args):
+        raise OSError(errno.ENOSYS, "Function not implemented")
+
+    def disk_full(*args):
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    def unexpected_copyfileobj(*args):
+        raise AssertionError("buffered copy retried a failed write")
+
+    monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+    monkeypatch.setattr(os, "sendfile", disk_full, raising=False)
+    monkeypatch.setattr(shutil, "copyfileobj", unexpected_copyfileobj)
+
+    with pytest.raises(OSError) as raised:
+        fs_ops.copy_file(source, tmp_path / "copy.MP4")
+
+    assert raised.value.errno == errno.ENOSPC
+
+
+def test_backup_with_tags_skips_identical_sources_in_one_run(tmp_path, monkeypatch):
+    from vflow.core import media_ops
+
+    archive_root = tmp_path / "archive"
+    archive_root.mkdir()
+    ingest = tmp_path / "Ingest"
+    _write_file(ingest / "card1" / "A.MP4", b"same bytes")
+    _write_file(ingest / "card2" / "A.MP4", b"same bytes")
+
+    tmp_config = tmp_path / "config.yml"
+    tmp_config.write_text(
+        f"locations:\n"
+        f"  archive: \"{archive_root}\"\n"
+        f"  exports: \"{tmp_path / 'exports'}\"\n"
+        f"  working:\n"
+        f"    laptop: \"{ingest}\"\n"
+    )
+    monkeypatch.setattr(vflow_config, "CONFIG_PATH", tmp_config)
+
+    def fake_tag_media_file(source_file, tags_str, destination=None):
+        # Tagging rewrites the copy, so it no longer matches its source.
+        with open(source_file, "ab") as handle:
+            handle.write(tags_str.encode())
+        return source_file
+
+    monkeypatch.setattr(media_ops, "tag_media_file", fake_tag_media_file)
+
+    result = runner.invoke(
+        app,
+        [
+            "backup",
+            "--source",
+            str(ingest),
+            "--destination",
+            "Video/RAW/New",
+            "--tags",
+            "trip",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    backup_folder = archive_root / "Video" / "RAW" / "New"
+    copies = sorted(backup_folder.glob("card*/A.MP4"))
+    assert len(copies) == 1
+    assert copies[0].read_bytes() == b"same bytestrip"
+    assert "1 unique files copied." in result.output
+    assert "1 duplicate files skipped." in result.output
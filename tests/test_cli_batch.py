@@ -0,0 +1,79 @@
+from pathlib import Path
+
+import yaml
+from typer.testing import CliRunner
+
+from vflow import config as vflow_config
+from vflow.main import app
+
+
+runner = CliRunner()
+
+
+def _configure(tmp_path: Path, monkeypatch) -> Path:
+    archive = tmp_path / "archive"
+    exports = tmp_path / "exports"
+    laptop = tmp_path / "laptop"
+    for path in (archive, exports, laptop):
+        path.mkdir()
+    config_path = tmp_path / "config.yml"
+    config_path.write_text(
+        yaml.safe_dump(
+            {
+                "version": 2,
+                "locations": {
+                    "archive": str(archive),
+                    "exports": str(exports),
+                    "working": {"laptop": str(laptop)},
+                },
+            }
+        )
+    )
+    monkeypatch.setattr(vflow_config, "CONFIG_PATH", config_path)
+    return archive
+
+
+def test_batch_runs_each_command_in_order(tmp_path, monkeypatch):
+    _configure(tmp_path, monkeypatch)
+    script = tmp_path / "steps.txt"
+    script.write_text(
+        "# nightly housekeeping\n"
+        "locations\n"
+        "\n"
+        "set working.travel_ssd '/Volumes/Travel SSD'  # quoted path\n"
+        "locations\n"
+    )
+
+    result = runner.invoke(app, ["batch", str(script)])
+
+    assert result.exit_code == 0, result.output
+    assert result.output.count("$ v-flow locations") == 2
+    assert "travel_ssd: /Volumes/Travel SSD" in result.output
+    saved = yaml.safe_load(vflow_config.CONFIG_PATH.read_text())
+    assert saved["locations"]["working"]["travel_ssd"] == "/Volumes/Travel SSD"
+
+
+def test_batch_stops_at_the_first_failing_command(tmp_path, monkeypatch):
+    _configure(tmp_path, monkeypatch)
+    script = tmp_path / "steps.txt"
+    script.write_text("locations\nlocations --no-such-flag\nset working.late /late\n")
+
+    result = runner.invoke(app, ["batch", str(script)])
+
+    assert result.exit_code == 2
+    assert "Batch stopped at line 2." in result.output
+    saved = yaml.safe_load(vflow_config.CONFIG_PATH.read_text())
+    assert "late" not in saved["locations"]["working"]
+
+
+def test_batch_reports_a_missing_argument_as_a_usage_error(tmp_path, monkeypatch):
+    _configure(tmp_path, monkeypatch)
+    script = tmp_path / "steps.txt"
+    script.write_text("set working.travel_ssd\nlocations\n")
+
+    result = runner.invoke(app, ["batch", str(script)])
+
+    assert result.exit_code == 2
+    assert "Line 1: Missing" in result.output
+    assert "Batch stopped at line 1." in result.output
+    assert "$ v-flow locations" not in result.output
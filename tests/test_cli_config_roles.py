@@ -118,3 +118,56 @@ def test_get_location_rejects_an_unavailable_working_location(tmp_path):
         assert getattr(error, "exit_code", None) == 1
     else:
         raise AssertionError("unavailable working location was accepted")
+
+
+def test_parsed_config_cache_is_reused_until_the_file_changes(tmp_path, monkeypatch):
+    config_path = tmp_path / "config.yml"
+    _write_role_config(
+        config_path, tmp_path / "archive", tmp_path / "exports", {"laptop": tmp_path}
+    )
+    monkeypatch.setattr(vflow_config, "CONFIG_PATH", config_path)
+    first = vflow_config.load_config()
+
+    def unexpected_parse(raw):
+        raise AssertionError("configuration was parsed again")
+
+    monkeypatch.setattr(vflow_config, "_CONFIG_CACHE", {})
+    monkeypatch.setattr(vflow_config, "_parse_config", unexpected_parse)
+    assert vflow_config.load_config() == first
+
+    monkeypatch.undo()
+    monkeypatch.setattr(vflow_config, "CONFIG_PATH", config_path)
+    _write_role_config(
+        config_path, tmp_path / "archive", tmp_path / "exports", {"travel": tmp_path}
+    )
+    assert "travel" in vflow_config.load_config()["locations"]["working"]
+
+
+def test_parsed_config_cache_from_another_version_is_validated_again(
+    tmp_path, monkeypatch
+):
+    config_path = tmp_path / "config.yml"
+    _write_role_config(
+        config_path, tmp_path / "archive", tmp_path / "exports", {"laptop": tmp_path}
+    )
+    monkeypatch.setattr(vflow_config, "CONFIG_PATH", config_path)
+    monkeypatch.setattr(vflow_config, "_CONFIG_CACHE", {})
+    vflow_config.load_config()
+
+    parsed = []
+    real_parse = vflow_config._parse_config
+
+    def counting_parse(raw):
+        parsed.append(raw)
+        return real_parse(raw)
+
+    monkeypatch.setattr(vflow_config, "_CONFIG_CACHE", {})
+    monkeypatch.setattr(vflow_config, "_parse_config", counting_parse)
+    monkeypatch.setattr(vflow_config, "__version__", "0.0.0")
+    vflow_config.load_config()
+    assert len(parsed) == 1
+
+    monkeypatch.setattr(vflow_config, "_CONFIG_CACHE", {})
+    monkeypatch.setattr(vflow_config, "CONFIG_VERSION", vflow_config.CONFIG_VERSION + 1)
+    vflow_config.load_config()
+    assert len(parsed) == 2
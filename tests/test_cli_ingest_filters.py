@@ -67,3 +67,35 @@ def test_ingest_with_files_range_filter(tmp_path, monkeypatch):
     assert len(archived_files) == 50
     assert archived_files[0] == "C3300.MP4"
     assert archived_files[-1] == "C3349.MP4"
+
+
+def test_photo_ingest_reports_recycled_names_instead_of_overwriting(
+    tmp_path, monkeypatch
+):
+    archive_root = tmp_path / "archive"
+    archive_root.mkdir()
+    card = tmp_path / "card" / "DCIM"
+    _write_video(card / "100MSDCF" / "DSC00001.ARW", b"first body")
+    _write_video(card / "101MSDCF" / "DSC00001.ARW", b"second camera body")
+    _write_video(card / "100MSDCF" / "DSC00002.ARW", b"other")
+
+    tmp_config = tmp_path / "config.yml"
+    tmp_config.write_text(
+        f"locations:\n"
+        f"  archive: \"{archive_root}\"\n"
+        f"  exports: \"{tmp_path / 'exports'}\"\n"
+        f"  working:\n"
+        f"    laptop: \"{tmp_path / 'laptop'}\"\n"
+    )
+    monkeypatch.setattr(vflow_config, "CONFIG_PATH", tmp_config)
+
+    result = runner.invoke(
+        app, ["photo-ingest", "--source", str(card), "--shoot", "Trip"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Name conflict" in result.output
+    assert "Copied:  2" in result.output
+    assert "Errors:  1" in result.output
+    shoot = archive_root / "Photo" / "RAW" / "Trip"
+    assert (shoot / "DSC00001.ARW").read_bytes() in (b"first body", b"second camera body")
@@ -182,6 +182,87 @@ def test_interrupted_ingest_retries_without_recopying_verified_files(tmp_path, m
     assert (batch / "manifest.json").exists()
 
 
+def test_retry_resumes_partial_copy_left_by_interruption(tmp_path, monkeypatch):
+    archive, _ = _configure(tmp_path, monkeypatch)
+    source = tmp_path / "card"
+    _write(source / "A.MP4", b"first-clip")
+    _write(source / "B.MP4", b"second-clip")
+    contents = archive / "Camera Originals" / "Shoot" / "card-a" / "contents"
+    _write(contents / ".A.MP4.vflow-part", b"first-")
+    _write(contents / ".B.MP4.vflow-part", b"stale-")
+
+    copied = []
+    original_copy_file = import_batch.copy_file
+
+    def record_copy_file(source_file, destination, *args, **kwargs):
+        copied.append(Path(source_file).name)
+        return original_copy_file(source_file, destination, *args, **kwargs)
+
+    monkeypatch.setattr(import_batch, "copy_file", record_copy_file)
+    result = runner.invoke(
+        app,
+        ["ingest", "-s", str(source), "-n", "Shoot", "--import-batch", "card-a"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert copied == ["B.MP4"]
+    assert (contents / "A.MP4").read_bytes() == b"first-clip"
+    assert (contents / "B.MP4").read_bytes() == b"second-clip"
+    assert not list(contents.glob(".*.vflow-part"))
+
+
+def test_retry_resumes_copy_interrupted_by_an_os_error(tmp_path, monkeypatch):
+    import errno
+    import os
+    import sys
+
+    import pytest
+
+    if not sys.platform.startswith("linux"):
+        pytest.skip("kernel copy paths are Linux-only")
+    archive, _ = _configure(tmp_path, monkeypatch)
+    source = tmp_path / "card"
+    clip = os.urandom(256 * 1024)
+    _write(source / "A.MP4", clip)
+    contents = archive / "Camera Originals" / "Shoot" / "card-a" / "contents"
+    real_sendfile = os.sendfile
+
+    def unsupported(*args):
+        raise OSError(errno.ENOSYS, "Function not implemented")
+
+    def failing_sendfile(out_fd, in_fd, offset, count):
+        if offset:
+            raise OSError(errno.EIO, "Input/output error")
+        return real_sendfile(out_fd, in_fd, offset, 4096)
+
+    # The fault is injected inside the real copy_file, after its
+    # preallocation, so the partial file is what an interrupted copy leaves.
+    command = ["ingest", "-s", str(source), "-n", "Shoot", "--import-batch", "card-a"]
+    with monkeypatch.context() as faults:
+        faults.setattr(os, "copy_file_range", unsupported, raising=False)
+        faults.setattr(os, "sendfile", failing_sendfile)
+        result = runner.invoke(app, command)
+
+    assert result.exit_code != 0
+    assert (contents / ".A.MP4.vflow-part").read_bytes() == clip[:4096]
+    assert not (contents / "A.MP4").exists()
+
+    copied = []
+    original_copy_file = import_batch.copy_file
+
+    def record_copy_file(source_file, destination, *args, **kwargs):
+        copied.append(Path(source_file).name)
+        return original_copy_file(source_file, destination, *args, **kwargs)
+
+    monkeypatch.setattr(import_batch, "copy_file", record_copy_file)
+    result = runner.invoke(app, command)
+
+    assert result.exit_code == 0, result.output
+    assert copied == []
+    assert (contents / "A.MP4").read_bytes() == clip
+    assert not list(contents.glob(".*.vflow-part"))
+
+
 def test_unavailable_working_location_does_not_block_archive_ingest(tmp_path, monkeypatch):
     archive, _ = _configure(tmp_path, monkeypatch)
     config = yaml.safe_load(vflow_config.CONFIG_PATH.read_text())
@@ -68,3 +68,69 @@ def test_restore_folder_dry_run_and_real(tmp_path):
     for i in range(50):
         assert (dest / "sub1" / f"clip_{i:03d}.mp4").read_text() == f"clip-{i}"
 
+
+
+def test_failed_copy_is_not_taken_for_a_finished_one(tmp_path, monkeypatch):
+    """
+    A copy that fails part way must leave a destination whose size gives it
+    away, so neither a rerun of restore-folder nor verify-backup accepts it.
+    """
+    import errno
+    import os
+    import sys
+
+    import pytest
+
+    if not sys.platform.startswith("linux"):
+        pytest.skip("kernel copy paths are Linux-only")
+    source = tmp_path / "src"
+    dest = tmp_path / "dest"
+    source.mkdir()
+    (source / "clip.mp4").write_bytes(os.urandom(256 * 1024))
+
+    real_sendfile = os.sendfile
+
+    def unsupported(*args):
+        raise OSError(errno.ENOSYS, "Function not implemented")
+
+    def failing_sendfile(out_fd, in_fd, offset, count):
+        if offset:
+            raise OSError(errno.EIO, "Input/output error")
+        return real_sendfile(out_fd, in_fd, offset, 4096)
+
+    monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+    monkeypatch.setattr(os, "sendfile", failing_sendfile)
+    command = ["restore-folder", "--source", str(source), "--destination", str(dest)]
+    result = runner.invoke(app, command)
+
+    assert "Errors: 1" in result.output
+    assert (dest / "clip.mp4").stat().st_size == 4096
+
+    monkeypatch.undo()
+    verify = runner.invoke(
+        app, ["verify-backup", "--source", str(source), "--destination", str(dest)]
+    )
+    assert "Backup verification PASSED" not in verify.output
+
+    rerun = runner.invoke(app, command)
+    assert "Skipped (already same): 0" in rerun.output
+
+
+def test_restore_folder_sees_files_under_symlinked_directories(tmp_path):
+    source = tmp_path / "src"
+    dest = tmp_path / "dest"
+    elsewhere = tmp_path / "elsewhere"
+    (source / "sub").mkdir(parents=True)
+    (source / "sub" / "b.txt").write_text("from source")
+    elsewhere.mkdir()
+    (elsewhere / "b.txt").write_text("kept")
+    dest.mkdir()
+    (dest / "sub").symlink_to(elsewhere, target_is_directory=True)
+
+    result = runner.invoke(
+        app, ["restore-folder", "--source", str(source), "--destination", str(dest)]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Conflicts (different, not overwritten): 1" in result.output
+    assert (elsewhere / "b.txt").read_text() == "kept"
@@ -1,7 +1,8 @@
 from typer.main import get_command
 from typer.testing import CliRunner
 
-from vflow.main import app
+from vflow import __version__
+from vflow.main import app, main
 
 
 runner = CliRunner()
@@ -31,3 +32,11 @@ def test_removed_backup_deletion_flags_are_absent() -> None:
     assert verify_help.exit_code == 0, verify_help.output
     assert "--delete-source" not in backup_help.output
     assert "--allow-delete" not in verify_help.output
+
+
+def test_version_flag_prints_package_version(monkeypatch, capsys) -> None:
+    monkeypatch.setattr("sys.argv", ["v-flow", "--version"])
+
+    main()
+
+    assert capsys.readouterr().out == f"v-flow {__version__}\n"
@@ -0,0 +1,47 @@
+from datetime import date, datetime, timedelta
+
+from vflow.core.date_utils import cluster_files_by_date
+
+
+def test_cluster_files_by_date_handles_empty_input():
+    assert cluster_files_by_date([], 6) == []
+
+
+def test_cluster_files_by_date_splits_at_the_gap_threshold_inclusive():
+    start = datetime(2025, 3, 1, 9, 0)
+    files = [
+        ("c.mp4", start + timedelta(hours=8)),
+        ("a.mp4", start),
+        ("b.mp4", start + timedelta(hours=2)),
+        ("d.mp4", start + timedelta(hours=13, seconds=59.5)),
+    ]
+
+    # b -> c is exactly 6 hours and splits; c -> d falls half a second short.
+    assert cluster_files_by_date(files, 6) == [["a.mp4", "b.mp4"], ["c.mp4", "d.mp4"]]
+
+
+def test_cluster_files_by_date_with_zero_gap_puts_every_file_alone():
+    moment = datetime(2025, 3, 1, 9, 0)
+    files = [("a.mp4", moment), ("b.mp4", moment), ("c.mp4", moment + timedelta(1))]
+
+    assert cluster_files_by_date(files, 0) == [["a.mp4"], ["b.mp4"], ["c.mp4"]]
+
+
+def test_cluster_files_by_date_treats_plain_dates_as_midnight():
+    files = [
+        ("day3.mp4", date(2025, 3, 3)),
+        ("day1.mp4", date(2025, 3, 1)),
+        ("day2.mp4", date(2025, 3, 2)),
+        ("day5.mp4", date(2025, 3, 5)),
+    ]
+
+    assert cluster_files_by_date(files, 24) == [
+        ["day1.mp4"],
+        ["day2.mp4"],
+        ["day3.mp4"],
+        ["day5.mp4"],
+    ]
+    assert cluster_files_by_date(files, 25) == [
+        ["day1.mp4", "day2.mp4", "day3.mp4"],
+        ["day5.mp4"],
+    ]
@@ -1,6 +1,11 @@
 from pathlib import Path
 
-from vflow.actions import _parse_range_pattern, _matches_pattern, list_duplicates
+from vflow.actions import (
+    _filter_by_patterns,
+    _matches_pattern,
+    _parse_range_pattern,
+    list_duplicates,
+)
 
 
 def test_parse_range_pattern_handles_various_prefix_forms():
@@ -31,6 +36,28 @@ def test_matches_pattern_range_selects_correct_count():
     assert matched[-1] == "C3349.MP4"
 
 
+def test_filter_by_patterns_matches_pairwise_selection():
+    """
+    The bisect-indexed filter must select exactly what testing every
+    (pattern, filename) pair with _matches_pattern selects, in order.
+    """
+    names = [f"C{n:04d}.MP4" for n in range(3280, 3370)]
+    names += ["c0100.mp4", "X0100.MP4", "A001C0042.MOV", "MVI_0001.MOV", "RANDOM.MOV"]
+    names += ["VID_20260305_123456.MP4", "C3310_v2.MOV", "NOTES"]
+    pattern_sets = [
+        ["C3300-C3349"],
+        ["3300-3310", "C3360"],
+        ["c0100-c0101", "MVI_", "random"],
+        ["A001-A001", "C3349-C3300", "0042"],
+        ["X0100-3360"],
+        [],
+    ]
+
+    for patterns in pattern_sets:
+        expected = [n for n in names if any(_matches_pattern(p, n) for p in patterns)]
+        assert _filter_by_patterns(names, patterns) == expected, patterns
+
+
 def test_matches_pattern_ignores_extension_and_case():
     """
     Pattern should match based on numeric range and prefix, regardless of case